@@ -1,4 +1,4 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -S
 #
 # inject-session-id.py — PreToolUse hook
 #
@@ -41,10 +41,12 @@ import re
 import shlex
 import sys
 
+SESSION_ID_RE = re.compile(r"^[A-Za-z0-9_-]+$")
+
 
 def main():
     try:
-        input_data = json.load(sys.stdin)
+        input_data = json.loads(sys.stdin.buffer.read())
 
         if input_data.get("tool_name", "") != "Bash":
             sys.exit(0)
@@ -52,7 +54,7 @@ def main():
         session_id = input_data.get("session_id", "")
         # Reject anything not matching the expected UUID-ish shape — stops
         # quote-escaping tricks from reaching the shell.
-        if not re.match(r"^[A-Za-z0-9_-]+$", session_id):
+        if not SESSION_ID_RE.match(session_id):
             sys.exit(0)
 
         command = input_data.get("tool_input", {}).get("command", "")
@@ -117,7 +119,7 @@ def main():
                 "updatedInput": {"command": new_command},
             }
         }
-        print(json.dumps(response))
+        sys.stdout.buffer.write(json.dumps(response, separators=(",", ":")).encode() + b"\n")
         sys.exit(0)
 
     except Exception as e:
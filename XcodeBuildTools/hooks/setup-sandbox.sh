@@ -43,7 +43,7 @@ set -euo pipefail
 
 # --- Read session_id from hook stdin payload ---
 input=$(cat)
-SESSION_ID=$(printf '%s' "$input" | /usr/bin/python3 -c \
+SESSION_ID=$(printf '%s' "$input" | /usr/bin/python3 -S -c \
     'import sys,json; print(json.load(sys.stdin).get("session_id",""))')
 
 if [[ -z "$SESSION_ID" ]]; then
@@ -1,4 +1,4 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -S
 """teardown-sandbox.py — Remove isolated Xcode build environment on session end.
 
 Reads session_id from the SessionEnd hook stdin payload and removes the
@@ -63,7 +63,7 @@ def anchor_still_referenced(sandbox_root: str, anchor: str) -> bool:
 
 def main() -> None:
     try:
-        payload = json.load(sys.stdin)
+        payload = json.loads(sys.stdin.buffer.read())
     except (json.JSONDecodeError, ValueError):
         return
 
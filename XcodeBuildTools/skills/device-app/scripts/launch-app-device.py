@@ -1,13 +1,14 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -S
 """
 Launch an app on a connected physical device.
 
 Usage:
-    launch-app-device.py --device-id UDID --app /path/to/MyApp.app
+    launch-app-device.py --device-id UDID --app /path/to/MyApp.app [--install]
 
 Arguments:
     --device-id UDID    Device UDID (from list-devices.py)
     --app PATH          Path to .app bundle to launch
+    --install           Install the .app bundle if it is not on the device yet
     --args ARGS         Optional arguments to pass to the app
 
 Output:
@@ -16,6 +17,7 @@ Output:
 
 import argparse
 import json
+import plistlib
 import subprocess
 import sys
 import os
@@ -23,19 +25,42 @@ import os
 
 def get_bundle_id(app_path):
     """Extract bundle identifier from app's Info.plist."""
+    # Read the plist in-process, the same way xcode-project's get-bundle-id.py
+    # does, instead of spawning PlistBuddy for a single key
     plist_path = os.path.join(app_path, "Info.plist")
+    try:
+        with open(plist_path, "rb") as f:
+            return plistlib.load(f).get("CFBundleIdentifier")
+    except Exception:
+        return None
+
+
+def install_app(device_id, app_path):
+    """Install app using devicectl (Xcode 15+)."""
     try:
         result = subprocess.run(
-            ["/usr/libexec/PlistBuddy", "-c", "Print :CFBundleIdentifier", plist_path],
+            ["xcrun", "devicectl", "device", "install", "app",
+             "--device", device_id, app_path],
             capture_output=True,
             text=True,
-            timeout=10
+            timeout=300  # 5 minute timeout for large apps
         )
+
         if result.returncode == 0:
-            return result.stdout.strip()
-        return None
-    except Exception:
-        return None
+            return True, "App installed successfully"
+        else:
+            return False, result.stderr.strip() or "Installation failed"
+
+    except subprocess.TimeoutExpired:
+        return False, "Installation timed out"
+    except Exception as e:
+        return False, str(e)
+
+
+def is_not_installed_error(message):
+    """Check whether a devicectl launch failed because the app is missing."""
+    message = message.lower()
+    return "not installed" in message or "no application" in message
 
 
 def launch_app(device_id, bundle_id, args=None):
@@ -80,6 +105,8 @@ def main():
     parser = argparse.ArgumentParser(description="Launch app on a physical device")
     parser.add_argument("--device-id", required=True, help="Device UDID")
     parser.add_argument("--app", required=True, help="Path to .app bundle")
+    parser.add_argument("--install", action="store_true",
+                        help="Install the app bundle if it is not on the device yet")
     parser.add_argument("--args", nargs="*", help="Arguments to pass to the app")
 
     args = parser.parse_args()
@@ -114,6 +141,27 @@ def main():
 
     success, message, pid = launch_app(device_id, bundle_id, args.args)
 
+    # Installing can take minutes, so only install when the launch shows the
+    # app is missing and then launch again
+    installed = False
+    if not success and args.install and is_not_installed_error(message):
+        installed, message = install_app(device_id, app_path)
+        if not installed:
+            print(json.dumps({
+                "success": False,
+                "error": message,
+                "device_id": device_id,
+                "app_path": app_path,
+                "bundle_id": bundle_id,
+                "hints": [
+                    "Ensure the device is connected and trusted",
+                    "Check that the app is signed for this device",
+                    "Verify Developer Mode is enabled on iOS 16+ devices"
+                ]
+            }))
+            sys.exit(1)
+        success, message, pid = launch_app(device_id, bundle_id, args.args)
+
     if success:
         result = {
             "success": True,
@@ -122,6 +170,8 @@ def main():
             "app_path": app_path,
             "bundle_id": bundle_id
         }
+        if installed:
+            result["installed"] = True
         if pid:
             result["pid"] = pid
         print(json.dumps(result))
@@ -133,7 +183,7 @@ def main():
             "app_path": app_path,
             "bundle_id": bundle_id,
             "hints": [
-                "Ensure the app is installed on the device",
+                "Ensure the app is installed on the device (or pass --install)",
                 "Check that the device is connected"
             ]
         }))
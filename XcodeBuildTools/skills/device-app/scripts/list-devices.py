@@ -1,20 +1,72 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -S
 """
 List connected physical Apple devices (iPhone, iPad, Apple Watch, Apple TV, Vision Pro).
 
 Usage:
-    list-devices.py
+    list-devices.py [--refresh]
+
+Arguments:
+    --refresh    Ignore cached results and query the devices again
 
 This script uses Xcode's devicectl (Xcode 15+) or falls back to xctrace for older versions.
+devicectl results are cached for a few seconds so repeated calls don't pay its startup cost.
+If devicectl failed on the previous run, xctrace is started alongside it rather than after it.
 
 Output:
     JSON with list of connected devices including UDID, name, platform, and connection status
 """
 
+import argparse
 import json
+import os
+import re
 import subprocess
 import sys
-import re
+import time
+
+
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/Library/Caches"),
+    "XcodeBuildTools"
+)
+DEVICES_CACHE_FILE = os.path.join(CACHE_DIR, "devices.json")
+DEVICES_CACHE_TTL = 10  # seconds
+# Present when devicectl failed on the previous run (e.g. Xcode < 15)
+DEVICECTL_FAILED_MARKER = os.path.join(CACHE_DIR, "devicectl-failed")
+
+# xctrace device line: "Device Name (OS Version) (UDID)"
+DEVICE_LINE_RE = re.compile(r'^(.+?)\s+\(([^)]+)\)\s+\(([A-Fa-f0-9-]+)\)$')
+
+
+def load_cached_devices():
+    """Return the cached devicectl device list, or None if missing or stale."""
+    try:
+        if time.time() - os.stat(DEVICES_CACHE_FILE).st_mtime >= DEVICES_CACHE_TTL:
+            return None
+        with open(DEVICES_CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_cached_devices(devices):
+    """Cache a devicectl device list, replacing the file atomically."""
+    tmp_file = DEVICES_CACHE_FILE + ".tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_file, 'w') as f:
+            json.dump(devices, f)
+        os.replace(tmp_file, DEVICES_CACHE_FILE)
+    except OSError:
+        pass
+
+
+def clear_cached_devices():
+    """Remove the cached device list."""
+    try:
+        os.unlink(DEVICES_CACHE_FILE)
+    except OSError:
+        pass
 
 
 def list_devices_devicectl():
@@ -38,20 +90,24 @@ def list_devices_devicectl():
         device_list = data.get("result", {}).get("devices", [])
 
         for device in device_list:
+            device_props = device.get("deviceProperties", {})
+            hardware_props = device.get("hardwareProperties", {})
+            connection_props = device.get("connectionProperties", {})
+
             # Skip simulators
-            if device.get("deviceProperties", {}).get("bootedFromSnapshot"):
+            if device_props.get("bootedFromSnapshot"):
                 continue
 
             device_info = {
                 "udid": device.get("identifier"),
-                "name": device.get("deviceProperties", {}).get("name"),
-                "platform": device.get("deviceProperties", {}).get("platform", "Unknown"),
-                "os_version": device.get("deviceProperties", {}).get("osVersionNumber"),
-                "model": device.get("hardwareProperties", {}).get("marketingName"),
-                "architecture": device.get("hardwareProperties", {}).get("cpuType", {}).get("name"),
-                "connected": device.get("connectionProperties", {}).get("tunnelState") == "connected",
-                "paired": device.get("connectionProperties", {}).get("pairingState") == "paired",
-                "developer_mode": device.get("deviceProperties", {}).get("developerModeStatus") == "enabled"
+                "name": device_props.get("name"),
+                "platform": device_props.get("platform", "Unknown"),
+                "os_version": device_props.get("osVersionNumber"),
+                "model": hardware_props.get("marketingName"),
+                "architecture": hardware_props.get("cpuType", {}).get("name"),
+                "connected": connection_props.get("tunnelState") == "connected",
+                "paired": connection_props.get("pairingState") == "paired",
+                "developer_mode": device_props.get("developerModeStatus") == "enabled"
             }
 
             # Only include actual devices (have UDID)
@@ -68,23 +124,38 @@ def list_devices_devicectl():
         return None, str(e)
 
 
-def list_devices_xctrace():
-    """Fallback: list devices using xctrace."""
-    try:
-        result = subprocess.run(
-            ["xcrun", "xctrace", "list", "devices"],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+def start_xctrace():
+    """Start `xctrace list devices` in the background and return the process."""
+    return subprocess.Popen(
+        ["xcrun", "xctrace", "list", "devices"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True
+    )
 
-        if result.returncode != 0:
+
+def list_devices_xctrace(proc=None):
+    """Fallback: list devices using xctrace.
+
+    Pass a process from start_xctrace() to collect a run that is already in flight.
+    """
+    try:
+        if proc is None:
+            proc = start_xctrace()
+        try:
+            stdout, _ = proc.communicate(timeout=30)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            return None, "Command timed out"
+
+        if proc.returncode != 0:
             return None, "xctrace failed"
 
         devices = []
         in_devices = False
 
-        for line in result.stdout.split('\n'):
+        for line in stdout.split('\n'):
             line = line.strip()
 
             if '== Devices ==' in line:
@@ -95,8 +166,7 @@ def list_devices_xctrace():
                 break
 
             if in_devices and line:
-                # Parse line format: "Device Name (OS Version) (UDID)"
-                match = re.match(r'^(.+?)\s+\(([^)]+)\)\s+\(([A-Fa-f0-9-]+)\)$', line)
+                match = DEVICE_LINE_RE.match(line)
                 if match:
                     devices.append({
                         "name": match.group(1).strip(),
@@ -110,13 +180,52 @@ def list_devices_xctrace():
         return None, str(e)
 
 
+def devicectl_failed_recently():
+    """Whether the last devicectl attempt on this machine failed."""
+    return os.path.exists(DEVICECTL_FAILED_MARKER)
+
+
+def record_devicectl_result(succeeded):
+    """Remember whether devicectl worked so the next run knows whether to speculate."""
+    try:
+        if succeeded:
+            os.unlink(DEVICECTL_FAILED_MARKER)
+        else:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            open(DEVICECTL_FAILED_MARKER, 'w').close()
+    except OSError:
+        pass
+
+
 def main():
-    # Try devicectl first (Xcode 15+)
-    devices, error = list_devices_devicectl()
+    parser = argparse.ArgumentParser(description="List connected physical Apple devices")
+    parser.add_argument("--refresh", action="store_true", help="Ignore cached results")
+
+    args = parser.parse_args()
+
+    if args.refresh:
+        clear_cached_devices()
+        devices = None
+    else:
+        devices = load_cached_devices()
 
     if devices is None:
-        # Fallback to xctrace
-        devices, error = list_devices_xctrace()
+        # If devicectl failed last time it will most likely fail again, so
+        # start the xctrace fallback alongside it instead of after it.
+        xctrace_proc = start_xctrace() if devicectl_failed_recently() else None
+
+        # Try devicectl first (Xcode 15+)
+        devices, error = list_devices_devicectl()
+        record_devicectl_result(devices is not None)
+
+        if devices is not None:
+            save_cached_devices(devices)
+            if xctrace_proc:
+                xctrace_proc.kill()
+                xctrace_proc.communicate()
+        else:
+            # Fallback to xctrace
+            devices, error = list_devices_xctrace(xctrace_proc)
 
     if devices is None:
         print(json.dumps({
@@ -1,4 +1,4 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -S
 """
 Stop a running app on a connected physical device.
 
@@ -15,120 +15,99 @@ Output:
 
 import argparse
 import json
+import plistlib
+import shutil
 import subprocess
 import sys
-import tempfile
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Resolved once; stop_app makes three devicectl calls through xcrun
+XCRUN = shutil.which("xcrun") or "xcrun"
 
 
 def get_bundle_id(app_path):
     """Extract bundle identifier from app's Info.plist."""
+    # Read the plist in-process, the same way xcode-project's get-bundle-id.py
+    # does, instead of spawning PlistBuddy for a single key
     plist_path = os.path.join(app_path, "Info.plist")
     try:
-        result = subprocess.run(
-            ["/usr/libexec/PlistBuddy", "-c", "Print :CFBundleIdentifier", plist_path],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()
-        return None
+        with open(plist_path, "rb") as f:
+            return plistlib.load(f).get("CFBundleIdentifier")
     except Exception:
         return None
 
 
-def get_app_name_for_bundle_id(device_id, bundle_id):
-    """Get the app name for a bundle ID by querying installed apps."""
+def run_devicectl_json(args):
+    """Run a devicectl info query and return its parsed JSON result, or None."""
     try:
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tmp:
-            tmp_path = tmp.name
-
+        # Use /dev/stdout to capture JSON output directly without temp files
         result = subprocess.run(
-            ["xcrun", "devicectl", "device", "info", "apps",
-             "--device", device_id, "--json-output", tmp_path],
+            [XCRUN, "devicectl"] + args + ["--json-output", "/dev/stdout"],
             capture_output=True,
             text=True,
             timeout=30
         )
-
-        if result.returncode == 0 and os.path.exists(tmp_path):
-            try:
-                with open(tmp_path) as f:
-                    data = json.load(f)
-                apps = data.get("result", {}).get("apps", [])
-                for app in apps:
-                    if app.get("bundleIdentifier") == bundle_id:
-                        return app.get("name")
-            except (json.JSONDecodeError, IOError):
-                pass
-            finally:
-                try:
-                    os.unlink(tmp_path)
-                except OSError:
-                    pass
-        return None
+        if result.returncode != 0:
+            return None
+        return json.loads(result.stdout).get("result", {})
     except Exception:
         return None
 
 
-def find_app_pid(device_id, app_name):
-    """Find the PID of a running app by its app name."""
-    try:
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tmp:
-            tmp_path = tmp.name
+def get_app_name_for_bundle_id(apps_result, bundle_id):
+    """Get the app name for a bundle ID from a `devicectl device info apps` result."""
+    if apps_result is None:
+        return None
+    for app in apps_result.get("apps", []):
+        if app.get("bundleIdentifier") == bundle_id:
+            return app.get("name")
+    return None
 
-        result = subprocess.run(
-            ["xcrun", "devicectl", "device", "info", "processes",
-             "--device", device_id, "--json-output", tmp_path],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
 
-        if result.returncode == 0 and os.path.exists(tmp_path):
-            try:
-                with open(tmp_path) as f:
-                    data = json.load(f)
-                processes = data.get("result", {}).get("runningProcesses", [])
-                app_name_lower = app_name.lower()
-
-                for proc in processes:
-                    exe = proc.get("executable", "").lower()
-                    # Match by app name in .app bundle path
-                    # e.g., /path/to/SurfTracker.app/SurfTracker
-                    if f"/{app_name_lower}.app/" in exe or exe.endswith(f"/{app_name_lower}"):
-                        return proc.get("processIdentifier")
-            except (json.JSONDecodeError, IOError):
-                pass
-            finally:
-                try:
-                    os.unlink(tmp_path)
-                except OSError:
-                    pass
-        return None
-    except Exception:
+def find_app_pid(processes_result, app_name):
+    """Find the PID of a running app by its app name in a `devicectl device info processes` result."""
+    if processes_result is None:
         return None
+    app_name_lower = app_name.lower()
+
+    for proc in processes_result.get("runningProcesses", []):
+        exe = proc.get("executable", "").lower()
+        # Match by app name in .app bundle path
+        # e.g., /path/to/SurfTracker.app/SurfTracker
+        if f"/{app_name_lower}.app/" in exe or exe.endswith(f"/{app_name_lower}"):
+            return proc.get("processIdentifier")
+    return None
 
 
 def stop_app(device_id, bundle_id):
     """Stop app using devicectl (Xcode 15+)."""
     try:
+        # The installed-apps and running-processes queries are independent and
+        # each takes seconds, so run them side by side.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            apps_future = pool.submit(
+                run_devicectl_json, ["device", "info", "apps", "--device", device_id])
+            processes_future = pool.submit(
+                run_devicectl_json, ["device", "info", "processes", "--device", device_id])
+            apps_result = apps_future.result()
+            processes_result = processes_future.result()
+
         # First, get the app name for this bundle ID
-        app_name = get_app_name_for_bundle_id(device_id, bundle_id)
+        app_name = get_app_name_for_bundle_id(apps_result, bundle_id)
 
         if app_name is None:
             return False, f"App with bundle ID '{bundle_id}' is not installed on this device"
 
         # Find the PID for the app
-        pid = find_app_pid(device_id, app_name)
+        pid = find_app_pid(processes_result, app_name)
 
         if pid is None:
             return True, "App was not running"
 
         # Terminate using the PID
         result = subprocess.run(
-            ["xcrun", "devicectl", "device", "process", "terminate",
+            [XCRUN, "devicectl", "device", "process", "terminate",
              "--device", device_id, "--pid", str(pid)],
             capture_output=True,
             text=True,
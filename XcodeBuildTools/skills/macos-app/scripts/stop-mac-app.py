@@ -1,26 +1,109 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -S
 """
 Stop a running macOS application.
 
 Usage:
     stop-mac-app.py --bundle-id com.example.MyApp
+    stop-mac-app.py --bundle-id com.example.MyApp com.example.Helper
     stop-mac-app.py --app-name "MyApp"
 
 Arguments:
-    --bundle-id BUNDLE    Bundle identifier of the app to stop
+    --bundle-id BUNDLE... Bundle identifier(s) of the app(s) to stop
     --app-name NAME       Name of the app to stop (as shown in Activity Monitor)
     --force               Force quit the app (SIGKILL)
 
 Output:
-    JSON with termination status
+    JSON with termination status. When several bundle IDs are given, a
+    "results" list holds one entry per app.
 """
 
 import argparse
+import ctypes
 import json
+import os
+import plistlib
+import signal
 import subprocess
 import sys
 
 
+LIBPROC_PATH = "/usr/lib/libproc.dylib"
+PROC_PIDPATHINFO_MAXSIZE = 4096
+
+
+def list_process_paths():
+    """Return (pid, executable path) for every process, using libproc."""
+    libproc = ctypes.CDLL(LIBPROC_PATH, use_errno=True)
+
+    # proc_listallpids returns the number of PIDs; the list can grow between
+    # calls, so leave some headroom
+    count = libproc.proc_listallpids(None, 0)
+    if count <= 0:
+        raise OSError(ctypes.get_errno(), "proc_listallpids failed")
+    pids = (ctypes.c_int * (count + 64))()
+    count = libproc.proc_listallpids(pids, ctypes.sizeof(pids))
+    if count <= 0:
+        raise OSError(ctypes.get_errno(), "proc_listallpids failed")
+
+    path = ctypes.create_string_buffer(PROC_PIDPATHINFO_MAXSIZE)
+    processes = []
+    for pid in pids[:count]:
+        if pid > 0 and libproc.proc_pidpath(pid, path, PROC_PIDPATHINFO_MAXSIZE) > 0:
+            processes.append((pid, os.fsdecode(path.value)))
+    return processes
+
+
+def find_pids_for_bundle_ids(bundle_ids):
+    """
+    Find PIDs whose executable lives in an app bundle with one of these IDs.
+
+    Processes are listed once, however many bundle IDs are requested.
+
+    Returns:
+        Dict mapping each bundle ID to a list of PIDs
+    """
+    pids = {bundle_id: [] for bundle_id in bundle_ids}
+    app_bundle_ids = {}
+    for pid, path in list_process_paths():
+        # Use the innermost bundle so helper apps nested inside another app
+        # are matched by their own identifier
+        index = path.rfind(".app/Contents/MacOS/")
+        if index == -1 or pid == os.getpid():
+            continue
+        app_path = path[:index + 4]
+        if app_path not in app_bundle_ids:
+            try:
+                with open(os.path.join(app_path, "Contents", "Info.plist"), "rb") as f:
+                    app_bundle_ids[app_path] = plistlib.load(f).get("CFBundleIdentifier")
+            except Exception:
+                app_bundle_ids[app_path] = None
+        if app_bundle_ids[app_path] in pids:
+            pids[app_bundle_ids[app_path]].append(pid)
+    return pids
+
+
+def kill_pids(pids):
+    """Send SIGKILL to an app's processes."""
+    killed = 0
+    for pid in pids:
+        try:
+            os.kill(pid, signal.SIGKILL)
+            killed += 1
+        except ProcessLookupError:
+            pass
+        except OSError as e:
+            return False, f"Failed to kill PID {pid}: {e.strerror}"
+
+    if killed:
+        return True, "App force quit"
+    return True, "App was not running"
+
+
+def applescript_string(value):
+    """Quote a value as an AppleScript string literal."""
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
 def stop_by_bundle_id(bundle_id, force=False):
     """Stop app by bundle identifier using osascript."""
     script = f'''
@@ -30,22 +113,13 @@ def stop_by_bundle_id(bundle_id, force=False):
     '''
 
     if force:
-        # Use pkill for force quit
+        # Match processes by their app bundle's identifier rather than
+        # pkill -f, which kills anything whose command line contains it
         try:
-            result = subprocess.run(
-                ["pkill", "-9", "-f", bundle_id],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode == 0:
-                return True, "App force quit"
-            elif result.returncode == 1:
-                return True, "App was not running"
-            else:
-                return False, result.stderr.strip()
-        except Exception as e:
-            return False, str(e)
+            pids = find_pids_for_bundle_ids([bundle_id])[bundle_id]
+        except (OSError, AttributeError) as e:
+            return False, f"Could not list processes: {e}"
+        return kill_pids(pids)
 
     try:
         result = subprocess.run(
@@ -69,13 +143,93 @@ def stop_by_bundle_id(bundle_id, force=False):
         return False, str(e)
 
 
+def stop_by_bundle_ids(bundle_ids, force=False):
+    """
+    Stop several apps by bundle identifier.
+
+    All apps are quit from a single osascript run, since launching osascript
+    is the slow part of quitting an app. Force quitting lists processes once
+    for all apps.
+
+    Returns:
+        List of (success, message) tuples, one per bundle ID
+    """
+    if force:
+        try:
+            pids = find_pids_for_bundle_ids(bundle_ids)
+        except (OSError, AttributeError) as e:
+            return [(False, f"Could not list processes: {e}")] * len(bundle_ids)
+        return [kill_pids(pids[bundle_id]) for bundle_id in bundle_ids]
+
+    # Each app reports one "index<TAB>status" record. Error messages can span
+    # several lines, so records are matched by index rather than line number.
+    # Each quit is compiled at run time by "run script", so an ID that cannot
+    # be resolved fails inside its own try instead of failing the whole script.
+    lines = ['set results to {}']
+    for index, bundle_id in enumerate(bundle_ids):
+        quit_script = f'tell application id {applescript_string(bundle_id)} to quit'
+        lines.extend([
+            'try',
+            f'    run script {applescript_string(quit_script)}',
+            f'    set end of results to "{index}" & tab & "ok"',
+            'on error errorMessage',
+            f'    set end of results to "{index}" & tab & errorMessage',
+            'end try',
+        ])
+    lines.extend([
+        "set AppleScript's text item delimiters to linefeed",
+        'return results as text',
+    ])
+
+    try:
+        result = subprocess.run(
+            ["osascript", "-e", "\n".join(lines)],
+            capture_output=True,
+            text=True,
+            timeout=30 * len(bundle_ids)
+        )
+        output = result.stdout
+    except subprocess.TimeoutExpired:
+        # No records are returned when the script is cut short, so every app
+        # is retried on its own below
+        output = ""
+    except Exception as e:
+        return [(False, str(e))] * len(bundle_ids)
+
+    outcomes = {}
+    index = None
+    for line in output.strip().splitlines():
+        number, tab, status = line.partition("\t")
+        if tab and number.isdigit():
+            index = int(number)
+            outcomes[index] = status
+        elif index is not None:
+            # Continuation of a multi-line error message
+            outcomes[index] += "\n" + line
+
+    results = []
+    for index, bundle_id in enumerate(bundle_ids):
+        outcome = outcomes.get(index)
+        if outcome is None:
+            # Quit the apps that got no record one at a time, so each gets
+            # its own outcome
+            results.append(stop_by_bundle_id(bundle_id))
+        elif outcome == "ok":
+            results.append((True, "App quit successfully"))
+        elif "not running" in outcome.lower():
+            results.append((True, "App was not running"))
+        else:
+            results.append((False, outcome))
+    return results
+
+
 def stop_by_name(app_name, force=False):
     """Stop app by name using killall."""
-    signal = "-9" if force else "-TERM"
+    kill_signal = "-9" if force else "-TERM"
 
     try:
         result = subprocess.run(
-            ["killall", signal, app_name],
+            ["killall", kill_signal, app_name],
             capture_output=True,
             text=True,
             timeout=10
@@ -95,15 +249,37 @@ def stop_by_name(app_name, force=False):
 def main():
     parser = argparse.ArgumentParser(description="Stop a macOS application")
     group = parser.add_mutually_exclusive_group(required=True)
-    group.add_argument("--bundle-id", help="Bundle identifier of the app")
+    group.add_argument("--bundle-id", nargs="+", help="Bundle identifier(s) of the app(s)")
     group.add_argument("--app-name", help="Name of the app")
     parser.add_argument("--force", action="store_true", help="Force quit the app")
 
     args = parser.parse_args()
 
+    # Stop several apps at once
+    if args.bundle_id and len(args.bundle_id) > 1:
+        results = [
+            {"success": success, "message" if success else "error": message, "identifier": bundle_id}
+            for bundle_id, (success, message) in zip(
+                args.bundle_id, stop_by_bundle_ids(args.bundle_id, args.force))
+        ]
+        failed = [r for r in results if not r["success"]]
+        response = {
+            "success": not failed,
+            "results": results,
+        }
+        if failed:
+            response["error"] = f"Failed to stop {len(failed)} of {len(results)} apps"
+            response["hint"] = "Try using --force to force quit"
+        else:
+            response["message"] = f"Stopped {len(results)} apps"
+        print(json.dumps(response))
+        if failed:
+            sys.exit(1)
+        return
+
     if args.bundle_id:
-        success, message = stop_by_bundle_id(args.bundle_id, args.force)
-        identifier = args.bundle_id
+        identifier = args.bundle_id[0]
+        success, message = stop_by_bundle_id(identifier, args.force)
     else:
         success, message = stop_by_name(args.app_name, args.force)
         identifier = args.app_name
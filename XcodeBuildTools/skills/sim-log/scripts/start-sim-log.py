@@ -1,4 +1,4 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -S
 """
 Start capturing logs from an iOS simulator.
 
@@ -11,53 +11,113 @@ Arguments:
     --output PATH         Optional file path to write logs (default: stdout)
     --level LEVEL         Log level filter: default, info, debug (default: default)
 
+The app's process name is looked up with simctl listapps and cached until apps are
+installed or removed on that simulator.
+
 Output:
     Streams logs to stdout or file. Press Ctrl+C to stop.
+    The script execs log stream directly, so stopping it ends the capture
+    without a final status message.
 """
 
 import argparse
 import json
-import re
+import os
+import plistlib
 import subprocess
 import sys
 
 
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/Library/Caches"),
+    "XcodeBuildTools"
+)
+APP_NAMES_CACHE_FILE = os.path.join(CACHE_DIR, "app-names.json")
+# Every install or removal adds or deletes a folder in here, changing its mtime
+SIM_APPLICATIONS_DIR = os.path.expanduser(
+    "~/Library/Developer/CoreSimulator/Devices/{udid}/data/Containers/Bundle/Application"
+)
+
+
+def applications_fingerprint(udid):
+    """Return the mtime of the simulator's installed-apps folder, or None if unavailable."""
+    try:
+        return os.stat(SIM_APPLICATIONS_DIR.format(udid=udid)).st_mtime_ns
+    except OSError:
+        return None
+
+
+def load_app_names_cache():
+    """Return the cached app names, keyed by "udid/bundle_id"."""
+    try:
+        with open(APP_NAMES_CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_app_names_cache(cache):
+    """Write the app names cache, replacing the file atomically."""
+    tmp_file = APP_NAMES_CACHE_FILE + ".tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_file, 'w') as f:
+            json.dump(cache, f)
+        os.replace(tmp_file, APP_NAMES_CACHE_FILE)
+    except OSError:
+        pass
+
+
 def get_app_name_from_bundle_id(udid, bundle_id):
     """Get the app name (CFBundleName) for a bundle ID from installed simulator apps."""
     try:
         result = subprocess.run(
             ["xcrun", "simctl", "listapps", udid],
             capture_output=True,
-            text=True,
             timeout=10
         )
         if result.returncode != 0:
             return None
 
-        output = result.stdout
-        # Parse the plist-style output to find CFBundleName for our bundle ID
-        # Look for pattern: CFBundleIdentifier = "bundle_id"; ... CFBundleName = AppName;
-        # The output groups apps by bundle ID, so we find our bundle section first
-
-        # Find the section for our bundle ID
-        pattern = rf'"{re.escape(bundle_id)}"\s*=\s*\{{'
-        match = re.search(pattern, output)
-        if not match:
+        # listapps prints an old-style (OpenStep) plist keyed by bundle ID,
+        # which plistlib can't read; have plutil convert it to XML first
+        converted = subprocess.run(
+            ["plutil", "-convert", "xml1", "-o", "-", "-"],
+            input=result.stdout,
+            capture_output=True,
+            timeout=10
+        )
+        if converted.returncode != 0:
             return None
 
-        # Find the CFBundleName within this app's section (before the next app section)
-        start_pos = match.end()
-        # Look for CFBundleName in this section
-        remaining = output[start_pos:]
-        name_match = re.search(r'CFBundleName\s*=\s*"?([^";]+)"?\s*;', remaining)
-        if name_match:
-            return name_match.group(1).strip()
-
-        return None
+        app = plistlib.loads(converted.stdout).get(bundle_id)
+        if not isinstance(app, dict):
+            return None
+        name = app.get("CFBundleName")
+        return name.strip() if isinstance(name, str) and name.strip() else None
     except Exception:
         return None
 
 
+def get_app_name(udid, bundle_id):
+    """Like get_app_name_from_bundle_id, but cached until the simulator's apps change."""
+    fingerprint = applications_fingerprint(udid)
+    if fingerprint is None:
+        return get_app_name_from_bundle_id(udid, bundle_id)
+
+    key = f"{udid}/{bundle_id}"
+    cache = load_app_names_cache()
+    entry = cache.get(key)
+    if isinstance(entry, dict) and entry.get("fingerprint") == fingerprint:
+        return entry.get("name")
+
+    name = get_app_name_from_bundle_id(udid, bundle_id)
+    if name:
+        cache[key] = {"fingerprint": fingerprint, "name": name}
+        save_app_names_cache(cache)
+    return name
+
+
 def main():
     parser = argparse.ArgumentParser(description="Start capturing simulator logs")
     parser.add_argument("--udid", required=True, help="Simulator UDID")
@@ -69,7 +129,7 @@ def main():
     args = parser.parse_args()
 
     # Get the actual app name from the simulator's installed apps
-    app_name = get_app_name_from_bundle_id(args.udid, args.bundle_id)
+    app_name = get_app_name(args.udid, args.bundle_id)
     if not app_name:
         # Fall back to last component of bundle ID (less reliable)
         app_name = args.bundle_id.split(".")[-1]
@@ -85,57 +145,42 @@ def main():
         "--level", args.level
     ]
 
-    output_file = None
     try:
+        status = {
+            "success": True,
+            "message": f"Started log capture for {args.bundle_id}",
+            "simulator": args.udid,
+        }
+        output_fd = None
         if args.output:
-            output_file = open(args.output, 'w')
-            target = output_file
-            # Print status to stderr so it doesn't go to the log file
-            sys.stderr.write(json.dumps({
-                "success": True,
-                "message": f"Started log capture for {args.bundle_id}",
-                "simulator": args.udid,
-                "output_file": args.output,
-                "hint": "Press Ctrl+C to stop capture"
-            }) + "\n")
-        else:
-            target = sys.stdout
-            # Print initial message to stderr
-            sys.stderr.write(json.dumps({
-                "success": True,
-                "message": f"Started log capture for {args.bundle_id}",
-                "simulator": args.udid,
-                "hint": "Press Ctrl+C to stop capture"
-            }) + "\n")
-
-        # Run log stream
-        process = subprocess.Popen(
-            cmd,
-            stdout=target,
-            stderr=subprocess.PIPE,
-            text=True
-        )
+            output_fd = os.open(args.output, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            status["output_file"] = args.output
+        status["hint"] = "Press Ctrl+C to stop capture"
+
+        # Print status to stderr so it doesn't go to the log
+        sys.stderr.write(json.dumps(status) + "\n")
+        sys.stderr.flush()
+        sys.stdout.flush()
+
+        # Nothing is post-processed, so replace this process with log stream
+        # rather than keeping Python around just to wait on it. It writes
+        # straight to our stdout, pointed at the output file if one was given.
+        saved_stdout = os.dup(1)
+        if output_fd is not None:
+            os.dup2(output_fd, 1)
+            os.close(output_fd)
+        try:
+            os.execvp(cmd[0], cmd)
+        except OSError:
+            os.dup2(saved_stdout, 1)
+            raise
 
-        # Wait for process or Ctrl+C
-        process.wait()
-
-    except KeyboardInterrupt:
-        if output_file:
-            output_file.close()
-        sys.stderr.write(json.dumps({
-            "success": True,
-            "message": "Log capture stopped"
-        }) + "\n")
     except Exception as e:
         print(json.dumps({
             "success": False,
             "error": str(e)
         }))
         sys.exit(1)
-    finally:
-        if output_file:
-            output_file.close()
-
 
 if __name__ == "__main__":
     main()
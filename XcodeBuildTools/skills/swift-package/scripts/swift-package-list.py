@@ -1,4 +1,4 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -S
 """
 List currently running Swift Package processes.
 
@@ -13,7 +13,7 @@ Output:
 """
 
 import json
-import sys
+import subprocess
 import os
 import time
 
@@ -30,6 +30,29 @@ def is_process_running(pid):
         return False
 
 
+def running_pids(pids):
+    """Return the subset of pids that are still running.
+
+    Checks all PIDs with a single `ps` call; falls back to probing each PID
+    with os.kill if ps can't be run.
+    """
+    if not pids:
+        return set()
+    try:
+        result = subprocess.run(
+            ["ps", "-p", ",".join(str(pid) for pid in pids), "-o", "pid="],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+        # ps exits 1 when some of the PIDs are gone; anything else is a failure
+        if result.returncode in (0, 1):
+            return {int(p) for p in result.stdout.split()}
+    except (OSError, ValueError, subprocess.TimeoutExpired):
+        pass
+    return {pid for pid in pids if is_process_running(pid)}
+
+
 def load_processes():
     """Load tracked processes from file."""
     if not os.path.exists(PROCESS_FILE):
@@ -42,11 +65,17 @@ def load_processes():
 
 
 def save_processes(processes):
-    """Save tracked processes to file."""
+    """Save tracked processes to file.
+
+    Writes to a temporary file and renames it over the original so readers
+    never see a partially written file.
+    """
+    tmp_file = PROCESS_FILE + ".tmp"
     try:
-        with open(PROCESS_FILE, 'w') as f:
+        with open(tmp_file, 'w') as f:
             json.dump(processes, f)
-    except IOError:
+        os.replace(tmp_file, PROCESS_FILE)
+    except OSError:
         pass
 
 
@@ -67,10 +96,11 @@ def main():
     active_processes = []
     updated_processes = {}
     current_time = time.time()
+    alive = running_pids([int(pid_str) for pid_str in processes])
 
     for pid_str, info in processes.items():
         pid = int(pid_str)
-        if is_process_running(pid):
+        if pid in alive:
             duration = int(current_time - info.get("start_time", current_time))
             active_processes.append({
                 "pid": pid,
@@ -81,8 +111,9 @@ def main():
             updated_processes[pid_str] = info
         # Remove dead processes
 
-    # Save cleaned up list
-    save_processes(updated_processes)
+    # Save cleaned up list (only if some processes have exited)
+    if len(updated_processes) != len(processes):
+        save_processes(updated_processes)
 
     print(json.dumps({
         "success": True,
@@ -1,4 +1,4 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -S
 """
 Run an executable target from a Swift Package using `swift run`.
 
@@ -15,16 +15,95 @@ Arguments:
     --parse-as-library     Add -parse-as-library flag for @main support
 
 Output:
-    JSON with success status, output or process ID (for background)
+    JSON with success status, output or process ID (for background).
+    Only the last 500 lines of stdout and of stderr are kept;
+    "output_truncated" is set when earlier lines were dropped.
 """
 
 import argparse
 import json
+import signal
 import subprocess
 import sys
 import os
-import signal
-import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+OUTPUT_TAIL_LINES = 500
+
+
+def read_tail(stream):
+    """Read a text stream to the end, keeping only its last OUTPUT_TAIL_LINES lines.
+
+    Returns:
+        Tuple of (text, truncated)
+    """
+    tail = deque(maxlen=OUTPUT_TAIL_LINES)
+    line_count = 0
+    for line in stream:
+        tail.append(line.rstrip("\n"))
+        line_count += 1
+    return "\n".join(tail).strip(), line_count > len(tail)
+
+
+def run_with_tail(cmd, cwd, timeout):
+    """
+    Run cmd, keeping only the last OUTPUT_TAIL_LINES lines of stdout and of stderr.
+
+    The process gets its own session so the whole group can be killed on
+    timeout, since `swift run` leaves the executable running as its own child.
+    That also takes it out of the terminal's foreground group, so SIGINT and
+    SIGTERM are forwarded to it while it runs.
+
+    Returns:
+        Tuple of (return_code, (stdout, truncated), (stderr, truncated), timed_out)
+    """
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+        cwd=cwd,
+        start_new_session=True
+    )
+
+    def signal_group(signum, frame=None):
+        try:
+            os.killpg(process.pid, signum)
+        except OSError:
+            pass
+
+    timed_out = threading.Event()
+
+    def kill_group():
+        timed_out.set()
+        signal_group(signal.SIGKILL)
+
+    previous_handlers = {
+        signum: signal.signal(signum, signal_group)
+        for signum in (signal.SIGINT, signal.SIGTERM)
+    }
+    timer = threading.Timer(timeout, kill_group)
+    timer.start()
+
+    try:
+        # Drain stderr on a worker so neither pipe can fill up and stall the process
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            stderr_future = pool.submit(read_tail, process.stderr)
+            stdout = read_tail(process.stdout)
+            stderr = stderr_future.result()
+        process.wait()
+    finally:
+        timer.cancel()
+        for signum, handler in previous_handlers.items():
+            signal.signal(signum, handler)
+        process.stdout.close()
+        process.stderr.close()
+
+    return process.returncode, stdout, stderr, timed_out.is_set()
 
 
 def main():
@@ -70,11 +149,13 @@ def main():
 
     try:
         if args.background:
-            # Run in background
+            # Run in background. Nothing reads the output once we exit, so
+            # don't hand the process pipes it could fill up and block on.
             process = subprocess.Popen(
                 cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 cwd=package_path,
                 start_new_session=True
             )
@@ -88,29 +169,33 @@ def main():
             }))
         else:
             # Run with timeout
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=package_path,
-                timeout=timeout
-            )
+            return_code, (stdout, stdout_truncated), (stderr, stderr_truncated), timed_out = \
+                run_with_tail(cmd, package_path, timeout)
+
+            if timed_out:
+                raise subprocess.TimeoutExpired(cmd, timeout)
 
-            if result.returncode == 0:
-                print(json.dumps({
+            if return_code == 0:
+                response = {
                     "success": True,
                     "message": "Execution completed",
                     "package_path": package_path,
-                    "output": result.stdout.strip() if result.stdout.strip() else "Completed with no output"
-                }))
+                    "output": stdout if stdout else "Completed with no output"
+                }
+                truncated = stdout_truncated
             else:
-                print(json.dumps({
+                response = {
                     "success": False,
                     "error": "Execution failed",
-                    "stderr": result.stderr.strip(),
-                    "stdout": result.stdout.strip(),
-                    "return_code": result.returncode
-                }))
+                    "stderr": stderr,
+                    "stdout": stdout,
+                    "return_code": return_code
+                }
+                truncated = stdout_truncated or stderr_truncated
+            if truncated:
+                response["output_truncated"] = True
+            print(json.dumps(response))
+            if return_code != 0:
                 sys.exit(1)
 
     except subprocess.TimeoutExpired:
@@ -1,4 +1,4 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -S
 """
 Stop a running Swift Package executable started with swift-package-run.
 
@@ -14,9 +14,11 @@ Output:
 """
 
 import argparse
+import fcntl
 import json
 import sys
 import os
+import select
 import signal
 import time
 
@@ -36,14 +38,43 @@ def load_processes():
 
 
 def save_processes(processes):
-    """Save tracked processes to file."""
+    """Save tracked processes to file.
+
+    Writes to a temporary file and renames it over the original so readers
+    never see a partially written file.
+    """
+    tmp_file = PROCESS_FILE + ".tmp"
     try:
-        with open(PROCESS_FILE, 'w') as f:
+        with open(tmp_file, 'w') as f:
             json.dump(processes, f)
-    except IOError:
+        os.replace(tmp_file, PROCESS_FILE)
+    except OSError:
         pass
 
 
+def untrack_process(pid):
+    """Remove a process from the tracking file and return its tracked info.
+
+    The read-modify-write is done under an exclusive lock so stops running in
+    parallel don't drop each other's changes.
+    """
+    try:
+        lock = open(PROCESS_FILE + ".lock", 'w')
+    except OSError:
+        lock = None
+    try:
+        if lock is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        processes = load_processes()
+        process_info = processes.pop(str(pid), None)
+        if process_info is not None:
+            save_processes(processes)
+        return process_info or {}
+    finally:
+        if lock is not None:
+            lock.close()
+
+
 def is_process_running(pid):
     """Check if a process is still running."""
     try:
@@ -53,6 +84,45 @@ def is_process_running(pid):
         return False
 
 
+def wait_for_exit(pid, timeout):
+    """Wait up to timeout seconds for a process to exit.
+
+    The process was started by another invocation, so it can't be waited on
+    with waitpid. On macOS a kqueue NOTE_EXIT event wakes us as soon as it
+    exits; elsewhere, or if registration is refused, fall back to polling.
+
+    Returns:
+        True if the process exited
+    """
+    if hasattr(select, "kqueue"):
+        try:
+            kq = select.kqueue()
+            try:
+                event = select.kevent(
+                    pid,
+                    filter=select.KQ_FILTER_PROC,
+                    flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                    fflags=select.KQ_NOTE_EXIT
+                )
+                if kq.control([event], 1, timeout):
+                    return True
+                return not is_process_running(pid)
+            finally:
+                kq.close()
+        except ProcessLookupError:
+            # Exited before the event could be registered
+            return True
+        except OSError:
+            pass
+
+    deadline = time.monotonic() + timeout
+    while is_process_running(pid):
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.1)
+    return True
+
+
 def main():
     parser = argparse.ArgumentParser(description="Stop a running Swift Package executable")
     parser.add_argument("--pid", type=int, required=True, help="Process ID to stop")
@@ -64,10 +134,7 @@ def main():
     # Check if process exists
     if not is_process_running(pid):
         # Remove from tracking if it exists
-        processes = load_processes()
-        if str(pid) in processes:
-            del processes[str(pid)]
-            save_processes(processes)
+        untrack_process(pid)
 
         print(json.dumps({
             "success": True,
@@ -85,26 +152,15 @@ def main():
             os.kill(pid, signal.SIGTERM)
 
             # Wait for process to terminate (with timeout)
-            timeout = 5  # seconds
-            start = time.time()
-            terminated = False
-
-            while time.time() - start < timeout:
-                if not is_process_running(pid):
-                    terminated = True
-                    break
-                time.sleep(0.1)
+            terminated = wait_for_exit(pid, 5)
 
             # Force kill if still running
-            if not terminated and is_process_running(pid):
+            if not terminated:
                 os.kill(pid, signal.SIGKILL)
-                time.sleep(0.5)
-                terminated = not is_process_running(pid)
+                terminated = wait_for_exit(pid, 0.5)
 
         # Remove from tracking
-        processes = load_processes()
-        process_info = processes.pop(str(pid), {})
-        save_processes(processes)
+        process_info = untrack_process(pid)
 
         if terminated:
             print(json.dumps({
@@ -1,4 +1,4 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -S
 """
 Diagnose Xcode development environment and check tool availability.
 
@@ -19,9 +19,24 @@ Output:
 
 import json
 import subprocess
-import sys
-import os
 import platform
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+
+# `xcodebuild -version` lines: "Xcode 15.0" and "Build version 15A240d"
+XCODE_VERSION_RE = re.compile(r'^(Xcode|Build version)\s+(.+)$', re.M | re.ASCII)
+
+# Reported tool name -> command looked up on PATH
+TOOL_COMMANDS = {
+    "xcodebuild": "xcodebuild",
+    "xcrun": "xcrun",
+    "simctl": "xcrun",
+    "swift": "swift",
+    "git": "git",
+    "pod": "pod",
+    "carthage": "carthage",
+}
 
 
 def run_command(cmd, timeout=30):
@@ -46,9 +61,9 @@ def get_xcode_version():
     """Get Xcode version."""
     success, output = run_command(["xcodebuild", "-version"])
     if success:
-        lines = output.split('\n')
-        version = lines[0].replace("Xcode ", "") if lines else "Unknown"
-        build = lines[1].replace("Build version ", "") if len(lines) > 1 else "Unknown"
+        fields = dict(XCODE_VERSION_RE.findall(output))
+        version = fields.get("Xcode", "Unknown")
+        build = fields.get("Build version", "Unknown")
         return {"installed": True, "version": version, "build": build}
     return {"installed": False, "error": output}
 
@@ -73,7 +88,9 @@ def get_swift_version():
 
 def get_simulator_count():
     """Count available simulators."""
-    success, output = run_command(["xcrun", "simctl", "list", "devices", "-j"])
+    # Let simctl drop devices from uninstalled runtimes; with several Xcodes
+    # installed those make up most of the (large) JSON payload.
+    success, output = run_command(["xcrun", "simctl", "list", "devices", "available", "-j"])
     if success:
         try:
             data = json.loads(output)
@@ -112,28 +129,33 @@ def check_command_available(cmd):
 
 
 def main():
-    diagnostics = {
-        "success": True,
-        "system": {
-            "os": platform.system(),
-            "os_version": platform.mac_ver()[0],
-            "architecture": platform.machine()
-        },
-        "xcode": get_xcode_version(),
-        "developer_dir": get_developer_dir(),
-        "swift": get_swift_version(),
-        "simulators": get_simulator_count(),
-        "devices": get_device_count(),
-        "tools": {
-            "xcodebuild": check_command_available("xcodebuild"),
-            "xcrun": check_command_available("xcrun"),
-            "simctl": check_command_available("xcrun"),
-            "swift": check_command_available("swift"),
-            "git": check_command_available("git"),
-            "pod": check_command_available("pod"),
-            "carthage": check_command_available("carthage")
+    # Every check shells out and none depends on another, so run them
+    # concurrently: total time is the slowest check instead of the sum of
+    # all of them.
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        checks = {
+            "xcode": pool.submit(get_xcode_version),
+            "developer_dir": pool.submit(get_developer_dir),
+            "swift": pool.submit(get_swift_version),
+            "simulators": pool.submit(get_simulator_count),
+            "devices": pool.submit(get_device_count),
+        }
+        tools = {
+            name: pool.submit(check_command_available, cmd)
+            for name, cmd in TOOL_COMMANDS.items()
+        }
+
+        diagnostics = {
+            "success": True,
+            "system": {
+                "os": platform.system(),
+                "os_version": platform.mac_ver()[0],
+                "architecture": platform.machine()
+            },
         }
-    }
+        for name, future in checks.items():
+            diagnostics[name] = future.result()
+        diagnostics["tools"] = {name: future.result() for name, future in tools.items()}
 
     # Determine overall health
     issues = []
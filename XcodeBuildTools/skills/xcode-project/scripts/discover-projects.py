@@ -1,4 +1,4 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -S
 """
 Discover Xcode projects and workspaces in a directory.
 
@@ -8,6 +8,7 @@ Usage:
 Arguments:
     --path PATH        Path to scan for Xcode projects (required)
     --max-depth N      Maximum directory depth to scan (default: 5)
+    --exclude-dir NAME Additional directory name to skip (repeatable)
 
 Output:
     JSON with lists of discovered .xcodeproj and .xcworkspace files
@@ -19,53 +20,59 @@ import os
 import sys
 
 # Directories to skip during scanning
-SKIP_DIRS = {
+SKIP_DIRS = frozenset({
     'build', 'Build', 'DerivedData', 'Pods', '.git', 'node_modules',
     '.build', 'Carthage', 'vendor', '.svn', '.hg'
-}
+})
 
 
-def discover_projects(path, max_depth=5):
-    """Recursively discover Xcode projects and workspaces."""
+def discover_projects(path, max_depth=5, exclude_dirs=()):
+    """Discover Xcode projects and workspaces up to max_depth levels below path.
+
+    path should already be absolute; the returned paths are built from it.
+    """
+    skip_dirs = SKIP_DIRS.union(exclude_dirs)
     projects = []
     workspaces = []
-    path = os.path.abspath(path)
 
-    def scan_directory(dir_path, current_depth):
-        if current_depth > max_depth:
-            return
+    # Depth-first walk with an explicit stack; results are sorted at the end,
+    # so visiting order doesn't matter.
+    stack = [(path, 0)]
+    while stack:
+        dir_path, current_depth = stack.pop()
 
+        # scandir's DirEntry carries the file type from the directory listing,
+        # so the symlink/dir checks below don't need a stat per entry
         try:
-            entries = os.listdir(dir_path)
-        except PermissionError:
-            return
+            with os.scandir(dir_path) as it:
+                entries = list(it)
         except OSError:
-            return
+            continue
+
+        # Workspaces inside a project bundle are Xcode internals, not real ones
+        inside_project = 'xcodeproj' in dir_path.lower()
 
         for entry in entries:
-            full_path = os.path.join(dir_path, entry)
+            name = entry.name
 
             # Skip symbolic links
-            if os.path.islink(full_path):
+            if entry.is_symlink():
                 continue
 
             # Check for Xcode bundles
-            if entry.endswith('.xcodeproj'):
-                projects.append(full_path)
+            if name.endswith('.xcodeproj'):
+                projects.append(entry.path)
                 continue  # Don't descend into xcodeproj
 
-            if entry.endswith('.xcworkspace'):
-                # Skip internal workspace files
-                if 'xcodeproj' not in dir_path.lower():
-                    workspaces.append(full_path)
+            if name.endswith('.xcworkspace'):
+                if not inside_project:
+                    workspaces.append(entry.path)
                 continue  # Don't descend into xcworkspace
 
-            # Recurse into directories
-            if os.path.isdir(full_path):
-                if entry not in SKIP_DIRS and not entry.startswith('.'):
-                    scan_directory(full_path, current_depth + 1)
-
-    scan_directory(path, 0)
+            # Descend into directories
+            if current_depth < max_depth and entry.is_dir(follow_symlinks=False):
+                if name not in skip_dirs and not name.startswith('.'):
+                    stack.append((entry.path, current_depth + 1))
 
     return sorted(projects), sorted(workspaces)
 
@@ -74,6 +81,8 @@ def main():
     parser = argparse.ArgumentParser(description="Discover Xcode projects and workspaces")
     parser.add_argument("--path", required=True, help="Path to scan")
     parser.add_argument("--max-depth", type=int, default=5, help="Maximum scan depth")
+    parser.add_argument("--exclude-dir", action="append", default=[],
+                        help="Additional directory name to skip (repeatable)")
 
     args = parser.parse_args()
 
@@ -86,7 +95,7 @@ def main():
         }))
         sys.exit(1)
 
-    projects, workspaces = discover_projects(scan_path, args.max_depth)
+    projects, workspaces = discover_projects(scan_path, args.max_depth, args.exclude_dir)
 
     result = {
         "success": True,
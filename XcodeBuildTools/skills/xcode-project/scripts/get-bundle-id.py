@@ -1,4 +1,4 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -S
 """
 Get the bundle identifier from an app bundle or Info.plist.
 
@@ -23,25 +23,74 @@ import plistlib
 
 
 def read_plist(path):
-    """Read a plist file and return its contents."""
+    """Read a plist file and return its contents, or None if it can't be read."""
+    # plistlib reads XML and binary plists in-process, which covers every
+    # Info.plist Xcode produces
+    try:
+        with open(path, 'rb') as f:
+            return plistlib.load(f)
+    except OSError:
+        return None
+    except Exception:
+        pass
+
+    # Old-style (OpenStep) plists need plutil to convert them first
     try:
-        # Try using plutil first (handles binary and XML plists)
         result = subprocess.run(
-            ["plutil", "-convert", "json", "-o", "-", path],
-            capture_output=True,
-            text=True
+            ["plutil", "-convert", "xml1", "-o", "-", path],
+            capture_output=True
         )
         if result.returncode == 0:
-            return json.loads(result.stdout)
+            return plistlib.loads(result.stdout)
     except Exception:
         pass
+    return None
 
-    # Fallback to plistlib
-    try:
-        with open(path, 'rb') as f:
-            return plistlib.load(f)
-    except Exception as e:
-        return None
+
+def resolve_plist_path(app_path):
+    """Return the Info.plist path inside an app bundle, or None if there isn't one.
+
+    iOS bundles keep it at the top level, macOS bundles under Contents/.
+    """
+    for plist_path in (os.path.join(app_path, "Info.plist"),
+                       os.path.join(app_path, "Contents", "Info.plist")):
+        if os.path.exists(plist_path):
+            return plist_path
+    return None
+
+
+def build_result(plist_data, plist_path, app_path=None):
+    """Build the JSON response for parsed Info.plist contents."""
+    bundle_id = plist_data.get("CFBundleIdentifier")
+    if not bundle_id:
+        return {
+            "success": False,
+            "error": "CFBundleIdentifier not found in Info.plist"
+        }
+
+    result = {
+        "success": True,
+        "bundle_id": bundle_id
+    }
+
+    # Only include optional metadata that is actually present
+    optional_fields = (
+        ("bundle_name", plist_data.get("CFBundleName")),
+        ("bundle_display_name", plist_data.get("CFBundleDisplayName")),
+        ("bundle_version", plist_data.get("CFBundleVersion")),
+        ("bundle_short_version", plist_data.get("CFBundleShortVersionString")),
+        ("minimum_os_version", plist_data.get("MinimumOSVersion") or plist_data.get("LSMinimumSystemVersion")),
+    )
+    for key, value in optional_fields:
+        if value is not None:
+            result[key] = value
+
+    result["plist_path"] = plist_path
+
+    if app_path:
+        result["app_path"] = app_path
+
+    return result
 
 
 def main():
@@ -62,15 +111,8 @@ def main():
             }))
             sys.exit(1)
 
-        # Check for Info.plist in both iOS (flat) and macOS (Contents/) locations
-        ios_plist_path = os.path.join(app_path, "Info.plist")
-        macos_plist_path = os.path.join(app_path, "Contents", "Info.plist")
-
-        if os.path.exists(ios_plist_path):
-            plist_path = ios_plist_path
-        elif os.path.exists(macos_plist_path):
-            plist_path = macos_plist_path
-        else:
+        plist_path = resolve_plist_path(app_path)
+        if plist_path is None:
             print(json.dumps({
                 "success": False,
                 "error": f"Info.plist not found in app bundle: {app_path}"
@@ -96,32 +138,10 @@ def main():
         }))
         sys.exit(1)
 
-    bundle_id = plist_data.get("CFBundleIdentifier")
-    if not bundle_id:
-        print(json.dumps({
-            "success": False,
-            "error": "CFBundleIdentifier not found in Info.plist"
-        }))
-        sys.exit(1)
-
-    result = {
-        "success": True,
-        "bundle_id": bundle_id,
-        "bundle_name": plist_data.get("CFBundleName"),
-        "bundle_display_name": plist_data.get("CFBundleDisplayName"),
-        "bundle_version": plist_data.get("CFBundleVersion"),
-        "bundle_short_version": plist_data.get("CFBundleShortVersionString"),
-        "minimum_os_version": plist_data.get("MinimumOSVersion") or plist_data.get("LSMinimumSystemVersion"),
-        "plist_path": plist_path
-    }
-
-    if app_path:
-        result["app_path"] = app_path
-
-    # Remove None values
-    result = {k: v for k, v in result.items() if v is not None}
-
+    result = build_result(plist_data, plist_path, app_path)
     print(json.dumps(result))
+    if not result["success"]:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -1,30 +1,92 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -S
 """
 List schemes for an Xcode project or workspace.
 
 Usage:
-    list-schemes.py --project /path/to/MyApp.xcodeproj
+    list-schemes.py --project /path/to/MyApp.xcodeproj [--refresh]
     list-schemes.py --workspace /path/to/MyApp.xcworkspace
 
 Arguments:
     --project PATH      Path to .xcodeproj file (mutually exclusive with --workspace)
     --workspace PATH    Path to .xcworkspace file (mutually exclusive with --project)
+    --refresh           Ignore cached schemes and run xcodebuild -list again
+
+Project schemes are cached until project.pbxproj or a scheme directory changes,
+since xcodebuild -list takes seconds even on small projects. Workspaces are not
+cached: their schemes come from every referenced project and package.
 
 Output:
     JSON with list of available schemes
 """
 
 import argparse
+import glob
+import hashlib
 import json
 import subprocess
 import sys
 import os
-import re
+
+
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/Library/Caches"),
+    "XcodeBuildTools",
+    "schemes"
+)
+
+
+def project_fingerprint(path):
+    """Return the modification times that determine a project's scheme list."""
+    sources = [
+        os.path.join(path, "project.pbxproj"),
+        os.path.join(path, "xcshareddata", "xcschemes"),
+    ]
+    sources.extend(sorted(glob.glob(os.path.join(path, "xcuserdata", "*.xcuserdatad", "xcschemes"))))
+
+    fingerprint = []
+    for source in sources:
+        try:
+            mtime = os.stat(source).st_mtime_ns
+        except OSError:
+            mtime = None
+        fingerprint.append([os.path.relpath(source, path), mtime])
+    return fingerprint
+
+
+def cache_file_for(path):
+    """Return the cache file used for a project path."""
+    key = hashlib.sha1(path.encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"{key}.json")
+
+
+def load_cached_schemes(path, fingerprint):
+    """Return cached schemes for path if the project hasn't changed, else None."""
+    try:
+        with open(cache_file_for(path), 'r') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("path") != path or data.get("fingerprint") != fingerprint:
+        return None
+    return data.get("schemes")
+
+
+def save_cached_schemes(path, fingerprint, schemes):
+    """Cache a project's schemes, replacing the file atomically."""
+    cache_file = cache_file_for(path)
+    tmp_file = cache_file + ".tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_file, 'w') as f:
+            json.dump({"path": path, "fingerprint": fingerprint, "schemes": schemes}, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
 
 
 def list_schemes(path, is_workspace=False):
-    """List schemes using xcodebuild -list."""
-    cmd = ["xcodebuild", "-list"]
+    """List schemes using xcodebuild -list -json."""
+    cmd = ["xcodebuild", "-list", "-json"]
 
     if is_workspace:
         cmd.extend(["-workspace", path])
@@ -42,29 +104,16 @@ def list_schemes(path, is_workspace=False):
         if result.returncode != 0:
             return None, result.stderr.strip()
 
-        # Parse schemes from output
-        output = result.stdout
-        schemes = []
-        in_schemes = False
-
-        for line in output.split('\n'):
-            line = line.strip()
-
-            if line == 'Schemes:':
-                in_schemes = True
-                continue
-
-            if in_schemes:
-                if line and not line.endswith(':'):
-                    schemes.append(line)
-                elif line.endswith(':') and line != 'Schemes:':
-                    # Reached another section
-                    break
+        # A project's schemes sit under "project", a workspace's under "workspace"
+        data = json.loads(result.stdout)
+        schemes = (data.get("workspace") or data.get("project") or {}).get("schemes", [])
 
         return schemes, None
 
     except subprocess.TimeoutExpired:
         return None, "Command timed out"
+    except ValueError:
+        return None, "Could not parse xcodebuild -list output"
     except Exception as e:
         return None, str(e)
 
@@ -74,6 +123,7 @@ def main():
     group = parser.add_mutually_exclusive_group(required=True)
     group.add_argument("--project", help="Path to .xcodeproj file")
     group.add_argument("--workspace", help="Path to .xcworkspace file")
+    parser.add_argument("--refresh", action="store_true", help="Ignore cached schemes")
 
     args = parser.parse_args()
 
@@ -93,7 +143,16 @@ def main():
         }))
         sys.exit(1)
 
-    schemes, error = list_schemes(path, is_workspace)
+    schemes = error = None
+    if not is_workspace:
+        fingerprint = project_fingerprint(path)
+        if not args.refresh:
+            schemes = load_cached_schemes(path, fingerprint)
+
+    if schemes is None:
+        schemes, error = list_schemes(path, is_workspace)
+        if schemes is not None and not is_workspace:
+            save_cached_schemes(path, fingerprint, schemes)
 
     if error:
         print(json.dumps({
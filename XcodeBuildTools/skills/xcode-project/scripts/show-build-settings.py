@@ -1,4 +1,4 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -S
 """
 Show xcodebuild build settings for a project/workspace and scheme.
 
@@ -9,69 +9,404 @@ Usage:
 Arguments:
     --project PATH      Path to .xcodeproj file (mutually exclusive with --workspace)
     --workspace PATH    Path to .xcworkspace file (mutually exclusive with --project)
-    --scheme NAME       Scheme name (required)
-    --configuration CFG Build configuration (Debug, Release, etc.)
+    --scheme NAME...    Scheme name(s) (required)
+    --configuration CFG Build configuration(s) (Debug, Release, etc.)
     --key KEY           Filter to show only specific key
+    --refresh           Ignore cached settings and run xcodebuild again
+
+Project settings are cached per scheme and configuration until project.pbxproj,
+a scheme, an .xcconfig file the project uses (or one it includes) or
+the selected Xcode changes. Workspaces are not cached.
 
 Output:
-    JSON with build settings
+    JSON with build settings. With several schemes and/or configurations,
+    every pair is queried in parallel and "settings" maps
+    scheme -> configuration -> result.
 """
 
 import argparse
+import glob
+import hashlib
 import json
 import subprocess
 import sys
 import os
 import re
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/Library/Caches"),
+    "XcodeBuildTools",
+    "build-settings"
+)
+
+# Read with readlink rather than by running xcode-select -p on every lookup
+XCODE_SELECT_LINK = "/var/db/xcode_select_link"
+
+# xcconfig include line: #include "Other.xcconfig" or #include? "Optional.xcconfig"
+XCCONFIG_INCLUDE_RE = re.compile(r'^\s*#include\??\s+"([^"]+)"', re.M)
+
+MAX_PARALLEL_XCODEBUILDS = 4
+
+# Setting line: "    KEY = VALUE" (VALUE may be empty or contain '=')
+SETTING_LINE_RE = re.compile(r'^\s*(\w+)\s*=\s*(.*?)\s*$')
 
+# Settings surfaced separately as "common_settings" in the output
+COMMON_SETTING_KEYS = (
+    "PRODUCT_NAME", "PRODUCT_BUNDLE_IDENTIFIER", "PRODUCT_MODULE_NAME",
+    "INFOPLIST_FILE", "BUILT_PRODUCTS_DIR", "TARGET_BUILD_DIR",
+    "CONFIGURATION_BUILD_DIR", "SWIFT_VERSION", "IPHONEOS_DEPLOYMENT_TARGET",
+    "MACOSX_DEPLOYMENT_TARGET", "SDKROOT", "ARCHS"
+)
 
-def parse_build_settings(output):
-    """Parse xcodebuild -showBuildSettings output into a dictionary."""
+
+def parse_build_settings(lines):
+    """Parse xcodebuild -showBuildSettings output lines into a dictionary.
+
+    Target headers ("Build settings for action build and target ...:") and
+    other non-setting lines don't match SETTING_LINE_RE and are skipped.
+    """
     settings = {}
-    current_target = None
-
-    for line in output.split('\n'):
-        # Check for target header
-        if line.startswith('Build settings for action'):
-            match = re.search(r'target "([^"]+)"', line)
-            if match:
-                current_target = match.group(1)
-            continue
+    match_setting = SETTING_LINE_RE.match
+
+    for line in lines:
+        match = match_setting(line)
+        if match:
+            settings[match.group(1)] = match.group(2)
+
+    return settings
 
-        # Parse setting lines (indented with spaces, KEY = VALUE format)
-        if '=' in line:
-            parts = line.split('=', 1)
-            if len(parts) == 2:
-                key = parts[0].strip()
-                value = parts[1].strip()
-                if key:
-                    settings[key] = value
 
+def parse_json_build_settings(stream):
+    """Parse xcodebuild -showBuildSettings -json output into a dictionary.
+
+    Later targets override earlier ones, as with the text parser. Returns
+    None if the output isn't JSON (e.g. xcodebuild failed).
+    """
+    try:
+        entries = json.load(stream)
+    except ValueError:
+        return None
+
+    settings = {}
+    for entry in entries:
+        settings.update(entry.get("buildSettings", {}))
     return settings
 
 
+def run_xcodebuild(cmd, parse, timeout):
+    """Run xcodebuild, handing its stdout pipe to parse() as it is produced.
+
+    stderr goes to a temp file so a chatty xcodebuild can't block on a full
+    pipe while stdout is being read.
+
+    Returns:
+        Tuple of (returncode, parse result, stderr). Raises subprocess.TimeoutExpired.
+    """
+    with tempfile.TemporaryFile(mode='w+') as stderr_file:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file, text=True)
+        timed_out = threading.Event()
+
+        def kill():
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(timeout, kill)
+        timer.start()
+        try:
+            with proc.stdout:
+                parsed = parse(proc.stdout)
+            proc.wait()
+        finally:
+            timer.cancel()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+
+        stderr_file.seek(0)
+        return proc.returncode, parsed, stderr_file.read()
+
+
+def show_build_settings(cmd, timeout=120):
+    """Run xcodebuild -showBuildSettings and parse its output.
+
+    Asks for -json output (Xcode 11+) and falls back to parsing the text
+    listing, straight off the pipe, when this xcodebuild rejects -json or
+    doesn't produce JSON.
+
+    Returns:
+        Tuple of (returncode, settings, stderr). Raises subprocess.TimeoutExpired.
+    """
+    returncode, settings, stderr = run_xcodebuild(
+        cmd + ["-json"], parse_json_build_settings, timeout)
+    if returncode == 0 and settings is not None:
+        return returncode, settings, stderr
+    if returncode != 0 and "-json" not in stderr:
+        # A real failure (bad scheme, broken project); don't run it twice
+        return returncode, {}, stderr
+
+    return run_xcodebuild(cmd, parse_build_settings, timeout)
+
+
+def referenced_xcconfig_files(path):
+    """
+    Return the .xcconfig files a project uses as base configurations.
+
+    project.pbxproj is converted to JSON with plutil and the references are
+    resolved through the project's group tree, so files outside the project
+    folder are found too.
+
+    Returns:
+        Sorted list of paths, or None if a reference can't be located
+    """
+    pbxproj = os.path.join(path, "project.pbxproj")
+    try:
+        with open(pbxproj, 'r', errors='replace') as f:
+            if "baseConfigurationReference" not in f.read():
+                return []
+        result = subprocess.run(
+            ["plutil", "-convert", "json", "-o", "-", pbxproj],
+            capture_output=True,
+            timeout=30
+        )
+        if result.returncode != 0:
+            return None
+        data = json.loads(result.stdout)
+        objects = data["objects"]
+        root = objects[data["rootObject"]]
+    except (OSError, ValueError, KeyError, TypeError, subprocess.TimeoutExpired):
+        return None
+
+    source_root = os.path.normpath(
+        os.path.join(os.path.dirname(path), root.get("projectDirPath", "")))
+    parents = {}
+    for object_id, obj in objects.items():
+        if isinstance(obj, dict):
+            for child in obj.get("children", ()):
+                parents[child] = object_id
+
+    def resolve(object_id):
+        obj = objects.get(object_id)
+        if not isinstance(obj, dict):
+            return None
+        source_tree = obj.get("sourceTree", "<group>")
+        if source_tree == "<absolute>":
+            base = "/"
+        elif source_tree == "SOURCE_ROOT":
+            base = source_root
+        elif source_tree == "<group>":
+            parent = parents.get(object_id)
+            base = resolve(parent) if parent else source_root
+        else:
+            # Relative to a build setting such as BUILT_PRODUCTS_DIR
+            return None
+        if base is None:
+            return None
+        return os.path.normpath(os.path.join(base, obj.get("path", "")))
+
+    files = set()
+    for obj in objects.values():
+        if not isinstance(obj, dict) or obj.get("isa") != "XCBuildConfiguration":
+            continue
+        if "baseConfigurationReference" in obj:
+            xcconfig = resolve(obj["baseConfigurationReference"])
+        elif "baseConfigurationReferenceAnchor" in obj:
+            # Xcode 16 synchronized folders: a folder plus a path inside it
+            anchor = resolve(obj["baseConfigurationReferenceAnchor"])
+            xcconfig = anchor and os.path.normpath(os.path.join(
+                anchor, obj.get("baseConfigurationReferenceRelativePath", "")))
+        else:
+            continue
+        if xcconfig is None:
+            return None
+        files.add(xcconfig)
+    return sorted(files)
+
+
+def with_xcconfig_includes(files):
+    """Return files plus every .xcconfig they #include, directly or indirectly."""
+    found = set()
+    stack = list(files)
+    while stack:
+        xcconfig = stack.pop()
+        if xcconfig in found:
+            continue
+        found.add(xcconfig)
+        try:
+            with open(xcconfig, 'r', errors='replace') as f:
+                text = f.read()
+        except OSError:
+            continue
+        for include in XCCONFIG_INCLUDE_RE.findall(text):
+            # <DEVELOPER_DIR>/... includes are covered by the Xcode version
+            if not include.startswith("<"):
+                stack.append(os.path.normpath(os.path.join(os.path.dirname(xcconfig), include)))
+    return sorted(found)
+
+
+def developer_dir():
+    """Return the active Xcode developer directory, or None if unknown."""
+    if os.environ.get("DEVELOPER_DIR"):
+        return os.environ["DEVELOPER_DIR"]
+    try:
+        return os.path.join(os.path.dirname(XCODE_SELECT_LINK), os.readlink(XCODE_SELECT_LINK))
+    except OSError:
+        return None
+
+
+def project_sources(path):
+    """Return the files, other than .xcconfigs, that determine a project's build settings."""
+    sources = [os.path.join(path, "project.pbxproj")]
+    # The scheme directories catch added and removed schemes, the files
+    # themselves catch in-place edits to targets and default configurations
+    scheme_dirs = [os.path.join(path, "xcshareddata", "xcschemes")]
+    scheme_dirs.extend(sorted(glob.glob(os.path.join(path, "xcuserdata", "*.xcuserdatad", "xcschemes"))))
+    for scheme_dir in scheme_dirs:
+        sources.append(scheme_dir)
+        sources.extend(sorted(glob.glob(os.path.join(scheme_dir, "*.xcscheme"))))
+
+    # Switching or updating Xcode changes SDK paths and defaults
+    xcode = developer_dir()
+    if xcode:
+        sources.append(os.path.join(xcode, os.pardir, "version.plist"))
+    return sources
+
+
+def settings_fingerprint(path, sources):
+    """Return the modification times of sources, relative to the project's folder."""
+    project_dir = os.path.dirname(path)
+    fingerprint = []
+    for source in sources:
+        try:
+            mtime = os.stat(source).st_mtime_ns
+        except OSError:
+            mtime = None
+        fingerprint.append([os.path.relpath(source, project_dir), mtime])
+    return fingerprint
+
+
+def cache_file_for(cmd):
+    """Return the cache file used for an xcodebuild command line."""
+    key = hashlib.sha1("\0".join(cmd).encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"{key}.json")
+
+
+def load_cached_settings(cmd, path, sources):
+    """Return cached settings for cmd if the project hasn't changed, else None.
+
+    The .xcconfig files come from the cache entry: they can only change when
+    project.pbxproj or one of those files changes, and both are fingerprinted.
+    """
+    try:
+        with open(cache_file_for(cmd), 'r') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    xcconfigs = data.get("xcconfigs")
+    if data.get("cmd") != cmd or not isinstance(xcconfigs, list):
+        return None
+    if data.get("fingerprint") != settings_fingerprint(path, sources + xcconfigs):
+        return None
+    return data.get("settings")
+
+
+def save_cached_settings(cmd, xcconfigs, fingerprint, settings):
+    """Cache the settings for cmd, replacing the file atomically."""
+    cache_file = cache_file_for(cmd)
+    tmp_file = cache_file + ".tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_file, 'w') as f:
+            json.dump({"cmd": cmd, "xcconfigs": xcconfigs, "fingerprint": fingerprint,
+                       "settings": settings}, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+
+def cached_build_settings(cmd, project=None, refresh=False):
+    """show_build_settings, answered from the cache while the project is unchanged.
+
+    Pass project=None to skip the cache entirely (e.g. for workspaces).
+    """
+    if project is None:
+        return show_build_settings(cmd)
+
+    sources = project_sources(project)
+    if not refresh:
+        settings = load_cached_settings(cmd, project, sources)
+        if settings is not None:
+            return 0, settings, ""
+
+    # Only a miss pays for locating the .xcconfig files; if one can't be
+    # located the result isn't cached
+    xcconfigs = referenced_xcconfig_files(project)
+    if xcconfigs is not None:
+        xcconfigs = with_xcconfig_includes(xcconfigs)
+        fingerprint = settings_fingerprint(project, sources + xcconfigs)
+
+    returncode, settings, stderr = show_build_settings(cmd)
+    if returncode == 0 and xcconfigs is not None:
+        save_cached_settings(cmd, xcconfigs, fingerprint, settings)
+    return returncode, settings, stderr
+
+
+def settings_report(cmd, key=None, project=None, refresh=False):
+    """Run one -showBuildSettings command and build its part of the JSON output."""
+    try:
+        returncode, settings, stderr = cached_build_settings(cmd, project, refresh)
+    except subprocess.TimeoutExpired:
+        return {"success": False, "error": "Command timed out"}
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+    if returncode != 0:
+        return {"success": False, "error": stderr.strip() or "Failed to get build settings"}
+
+    # Filter by key if specified
+    if key:
+        if key not in settings:
+            return {
+                "success": False,
+                "error": f"Setting key not found: {key}",
+                "available_keys": list(settings.keys())[:20],
+                "note": "Showing first 20 available keys"
+            }
+        settings = {key: settings[key]}
+
+    # Highlight commonly used settings
+    common_settings = {k: settings[k] for k in COMMON_SETTING_KEYS if k in settings}
+
+    return {
+        "success": True,
+        "common_settings": common_settings,
+        "all_settings": settings,
+        "settings_count": len(settings)
+    }
+
+
 def main():
     parser = argparse.ArgumentParser(description="Show Xcode build settings")
     group = parser.add_mutually_exclusive_group(required=True)
     group.add_argument("--project", help="Path to .xcodeproj file")
     group.add_argument("--workspace", help="Path to .xcworkspace file")
-    parser.add_argument("--scheme", required=True, help="Scheme name")
-    parser.add_argument("--configuration", help="Build configuration (Debug, Release)")
+    parser.add_argument("--scheme", required=True, nargs="+", help="Scheme name(s)")
+    parser.add_argument("--configuration", nargs="+",
+                        help="Build configuration(s) (Debug, Release)")
     parser.add_argument("--key", help="Show only this specific setting key")
+    parser.add_argument("--refresh", action="store_true", help="Ignore cached settings")
 
     args = parser.parse_args()
 
     if args.project:
         path = os.path.abspath(args.project)
         path_type = "project"
-        cmd = ["xcodebuild", "-showBuildSettings", "-project", path, "-scheme", args.scheme]
     else:
         path = os.path.abspath(args.workspace)
         path_type = "workspace"
-        cmd = ["xcodebuild", "-showBuildSettings", "-workspace", path, "-scheme", args.scheme]
-
-    if args.configuration:
-        cmd.extend(["-configuration", args.configuration])
 
     if not os.path.exists(path):
         print(json.dumps({
@@ -80,70 +415,59 @@ def main():
         }))
         sys.exit(1)
 
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=120
-        )
+    project = path if path_type == "project" else None
 
-        if result.returncode != 0:
-            print(json.dumps({
-                "success": False,
-                "error": result.stderr.strip() or "Failed to get build settings",
-                "path": path,
-                "scheme": args.scheme
-            }))
-            sys.exit(1)
+    configurations = args.configuration or [None]
+    combinations = [(scheme, cfg) for scheme in args.scheme for cfg in configurations]
+    commands = []
+    for scheme, cfg in combinations:
+        cmd = ["xcodebuild", "-showBuildSettings", f"-{path_type}", path, "-scheme", scheme]
+        if cfg:
+            cmd.extend(["-configuration", cfg])
+        commands.append(cmd)
 
-        settings = parse_build_settings(result.stdout)
-
-        # Filter by key if specified
-        if args.key:
-            if args.key in settings:
-                settings = {args.key: settings[args.key]}
-            else:
-                print(json.dumps({
-                    "success": False,
-                    "error": f"Setting key not found: {args.key}",
-                    "available_keys": list(settings.keys())[:20],
-                    "note": "Showing first 20 available keys"
-                }))
-                sys.exit(1)
-
-        # Highlight commonly used settings
-        common_keys = [
-            "PRODUCT_NAME", "PRODUCT_BUNDLE_IDENTIFIER", "PRODUCT_MODULE_NAME",
-            "INFOPLIST_FILE", "BUILT_PRODUCTS_DIR", "TARGET_BUILD_DIR",
-            "CONFIGURATION_BUILD_DIR", "SWIFT_VERSION", "IPHONEOS_DEPLOYMENT_TARGET",
-            "MACOSX_DEPLOYMENT_TARGET", "SDKROOT", "ARCHS"
-        ]
-
-        common_settings = {k: settings.get(k) for k in common_keys if k in settings}
+    if len(commands) == 1:
+        scheme, cfg = combinations[0]
+        report = settings_report(commands[0], args.key, project, args.refresh)
+        if not report["success"]:
+            report["path"] = path
+            report["scheme"] = scheme
+            print(json.dumps(report))
+            sys.exit(1)
 
         print(json.dumps({
             "success": True,
             "path": path,
             "type": path_type,
-            "scheme": args.scheme,
-            "configuration": args.configuration or "Default",
-            "common_settings": common_settings,
-            "all_settings": settings,
-            "settings_count": len(settings)
+            "scheme": scheme,
+            "configuration": cfg or "Default",
+            "common_settings": report["common_settings"],
+            "all_settings": report["all_settings"],
+            "settings_count": report["settings_count"]
         }))
+        return
 
-    except subprocess.TimeoutExpired:
-        print(json.dumps({
-            "success": False,
-            "error": "Command timed out"
-        }))
-        sys.exit(1)
-    except Exception as e:
-        print(json.dumps({
-            "success": False,
-            "error": str(e)
-        }))
+    # Each xcodebuild spends seconds loading the project on its own, so
+    # several scheme/configuration pairs are resolved side by side
+    with ThreadPoolExecutor(max_workers=min(len(commands), MAX_PARALLEL_XCODEBUILDS)) as pool:
+        reports = list(pool.map(
+            lambda cmd: settings_report(cmd, args.key, project, args.refresh), commands))
+
+    settings = {}
+    for (scheme, cfg), report in zip(combinations, reports):
+        settings.setdefault(scheme, {})[cfg or "Default"] = report
+    failed = sum(1 for report in reports if not report["success"])
+
+    result = {
+        "success": not failed,
+        "path": path,
+        "type": path_type,
+        "settings": settings
+    }
+    if failed:
+        result["error"] = f"Failed to get build settings for {failed} of {len(reports)} scheme/configuration pairs"
+    print(json.dumps(result))
+    if failed:
         sys.exit(1)
 
 
@@ -1,11 +1,18 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -S
 
 import sys
 import json
 import os
-import re
 
-from version_tracker import load_json_file, save_json_file
+def read_stdin() -> bytes:
+    """Read the hook payload straight from fd 0, bypassing sys.stdin."""
+    chunks = []
+    while True:
+        chunk = os.read(0, 1 << 16)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
 
 def allow():
     response = {
@@ -14,7 +21,7 @@ def allow():
             "permissionDecision": "allow"
         }
     }
-    print(json.dumps(response))
+    sys.stdout.buffer.write(json.dumps(response, separators=(",", ":")).encode() + b"\n")
     sys.exit(0)
 
 def deny(message: str):
@@ -25,12 +32,31 @@ def deny(message: str):
             "permissionDecisionReason": message
         }
     }
-    print(json.dumps(response))
+    sys.stdout.buffer.write(json.dumps(response, separators=(",", ":")).encode() + b"\n")
     sys.exit(0)
 
 
 def main():
     try:
+        # Read JSON from stdin
+        payload = read_stdin()
+        if not payload:
+            sys.exit(0)
+        input_data = json.loads(payload)
+
+        tool_name = input_data.get("tool_name", "")
+        tool_input = input_data.get("tool_input", {})
+        command = tool_input.get("command", "")
+
+        used_skill = tool_input.get("skill", "")
+
+        # Nothing below applies unless this is a Bash command or a Skill
+        # invocation, so bail out before touching plugin.json/info.json.
+        if not ((tool_name == "Bash" and command) or (tool_name == "Skill" and used_skill)):
+            sys.exit(0)
+
+        from version_tracker import load_json_file, save_json_file
+
         # Get plugin name from plugin.json
         plugin_dir = os.environ.get('CLAUDE_PLUGIN_ROOT', '')
         plugin_json_path = os.path.join(plugin_dir, ".claude-plugin", "plugin.json")
@@ -41,15 +67,6 @@ def main():
         info_data = load_json_file(info_file) or {}
         skills = info_data.get('skills', [])
 
-        # Read JSON from stdin
-        input_data = json.load(sys.stdin)
-
-        tool_name = input_data.get("tool_name", "")
-        tool_input = input_data.get("tool_input", {})
-        command = tool_input.get("command", "")
-
-        used_skill = tool_input.get("skill", "")
-
         if plugin_name and tool_name == "Skill" and (used_skill in skills or used_skill.startswith(f"{plugin_name}:")):
             allow()
 
@@ -60,6 +77,11 @@ def main():
         if tool_name == "Bash" and command:
             rules = info_data.get('pre-tool-use-rules', [])
 
+            # Deferred: most invocations never reach a rule check, so they
+            # shouldn't pay for importing the regex engine at startup.
+            if rules:
+                import re
+
             for rule in rules:
                 rule_name = rule.get('name', '')
                 match_pattern = rule.get('match', '')
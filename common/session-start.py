@@ -1,11 +1,15 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -S
 
 import sys
 import json
 import os
 import re
 
-from version_tracker import check_for_updates, load_json_file
+# Plugin layout, resolved once from the environment
+PLUGIN_DIR = os.environ.get('CLAUDE_PLUGIN_ROOT', '')
+PLUGIN_JSON_PATH = os.path.join(PLUGIN_DIR, ".claude-plugin", "plugin.json")
+INFO_JSON_PATH = os.path.join(PLUGIN_DIR, "info.json")
+MD_FILE = os.path.join(PLUGIN_DIR, "session-start.md")
 
 
 def derive_config_filename(plugin_name: str) -> str:
@@ -18,29 +22,26 @@ def derive_config_filename(plugin_name: str) -> str:
 
 def main():
     try:
-        # Get the plugin directory from environment
-        plugin_dir = os.environ.get('CLAUDE_PLUGIN_ROOT', '')
-        if not plugin_dir:
+        if not PLUGIN_DIR:
             sys.exit(0)
 
+        from version_tracker import check_for_updates, load_json_file
+
         # Load plugin name from plugin.json
-        plugin_json_path = os.path.join(plugin_dir, ".claude-plugin", "plugin.json")
-        plugin_json = load_json_file(plugin_json_path) or {}
+        plugin_json = load_json_file(PLUGIN_JSON_PATH) or {}
         plugin_name = plugin_json.get('name', 'Plugin')
 
         # Load welcome message from info.json
-        info_json_path = os.path.join(plugin_dir, "info.json")
-        info_json = load_json_file(info_json_path) or {}
+        info_json = load_json_file(INFO_JSON_PATH) or {}
         welcome_message = info_json.get('welcomeMessage', '')
 
         config_filename = derive_config_filename(plugin_name)
-        md_file = os.path.join(plugin_dir, "session-start.md")
 
-        # Read the markdown file
-        if os.path.exists(md_file):
-            with open(md_file, 'r', encoding='utf-8') as f:
+        # Read the markdown file (not every plugin ships one)
+        try:
+            with open(MD_FILE, 'r', encoding='utf-8') as f:
                 additional_context = f.read()
-        else:
+        except FileNotFoundError:
             additional_context = ""
 
         # Detect Xcode MCP availability (fail-open: treat as unavailable on error)
@@ -80,7 +81,7 @@ def main():
 
         # Check for version updates
         changelog, _ = check_for_updates(
-            plugin_dir=plugin_dir,
+            plugin_dir=PLUGIN_DIR,
             config_filename=config_filename,
             plugin_name=plugin_name
         )
@@ -96,7 +97,7 @@ def main():
             }
         }
 
-        print(json.dumps(response))
+        sys.stdout.buffer.write(json.dumps(response, separators=(",", ":")).encode() + b"\n")
         sys.exit(0)
 
     except Exception as e:
@@ -35,19 +35,37 @@ def get_new_versions(versions_list, last_version):
     return new_versions
 
 
+# Parsed JSON files keyed by path, each stored as ((mtime_ns, size), data).
+# session-start reads info.json both directly and via check_for_updates, so
+# the second read is served from here as long as the file hasn't changed.
+_json_cache = {}
+
+
 def load_json_file(file_path):
-    """Load a JSON file, returning empty dict/list on error."""
-    if not os.path.exists(file_path):
+    """Load a JSON file, returning None on error."""
+    try:
+        st = os.stat(file_path)
+    except OSError:
         return None
+
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _json_cache.get(file_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            data = json.load(f)
     except (json.JSONDecodeError, IOError):
         return None
 
+    _json_cache[file_path] = (stamp, data)
+    return data
+
 
 def save_json_file(file_path, data):
     """Save data to a JSON file, creating parent directories if needed."""
+    _json_cache.pop(file_path, None)
     try:
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         with open(file_path, 'w', encoding='utf-8') as f:
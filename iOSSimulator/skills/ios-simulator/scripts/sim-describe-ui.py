@@ -287,24 +287,20 @@ def calculate_center(frame: dict) -> dict:
     }
 
 
+# Element attributes searched by --find-text / --find-exact
+TEXT_ATTRIBUTES = ('AXLabel', 'AXTitle', 'AXDescription', 'AXValue', 'AXPlaceholderValue')
+
+
 def element_matches_text(element: dict, text: str, fuzzy: bool = True) -> bool:
-    """Check if an element's text fields contain the search text."""
-    searchable = ' '.join(filter(None, [
-        element.get('AXLabel'),
-        element.get('AXTitle'),
-        element.get('AXDescription'),
-        element.get('AXValue'),
-        element.get('AXPlaceholderValue'),
-    ]))
+    """Check if an element's text fields contain the search text.
+
+    For fuzzy matching, text must already be lowercased so the query isn't
+    re-lowered for every element in the tree.
+    """
+    values = [element.get(attr) for attr in TEXT_ATTRIBUTES]
     if fuzzy:
-        return text.lower() in searchable.lower()
-    return text in [
-        element.get('AXLabel'),
-        element.get('AXTitle'),
-        element.get('AXDescription'),
-        element.get('AXValue'),
-        element.get('AXPlaceholderValue'),
-    ]
+        return text in ' '.join(filter(None, values)).lower()
+    return text in values
 
 
 def find_elements(tree: dict,
@@ -329,13 +325,15 @@ def find_elements(tree: dict,
     flat_list: list[dict] = []
     flatten_tree(tree, flat_list)
 
+    text_lower = text.lower() if text else None
+
     matches = []
     for element in flat_list:
         if element_type and element.get('AXRole') != element_type:
             continue
         if identifier and element.get('AXIdentifier') != identifier:
             continue
-        if text and not element_matches_text(element, text, fuzzy=True):
+        if text_lower and not element_matches_text(element, text_lower, fuzzy=True):
             continue
         if exact_text and not element_matches_text(element, exact_text, fuzzy=False):
             continue
@@ -635,7 +633,10 @@ def main():
         ios_only = not args.include_chrome
         result = describe_simulator_ui(device_name, args.format, args.max_depth, ios_only)
 
-    print(json.dumps(result, indent=2))
+    # Compact output: the nested tree is deeply indented, so pretty-printing
+    # makes it several times larger and goes through json's slow pure-Python
+    # indent path.
+    print(json.dumps(result, separators=(',', ':')))
 
     if not result.get('success'):
         sys.exit(1)
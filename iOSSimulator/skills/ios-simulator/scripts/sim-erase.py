@@ -6,16 +6,18 @@ Preserves the device UUID, which is faster than deleting and recreating.
 
 Usage:
     sim-erase.py --udid <udid>
+    sim-erase.py --udid <udid> <udid> ...
     sim-erase.py --name "iPhone 15"
     sim-erase.py --all
 
 Options:
-    --udid <udid>       Erase simulator by UDID
+    --udid <udid>...    Erase simulator(s) by UDID; several are erased in parallel
     --name <name>       Erase simulator by name
     --all               Erase all simulators
 
 Output:
-    JSON object with success status and details.
+    JSON object with success status and details. When several UDIDs are
+    given, a "results" list holds one entry per simulator.
 
 Notes:
     - The simulator must be shut down before erasing
@@ -27,15 +29,55 @@ Notes:
 import json
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 
-from sim_utils import run_simctl, get_booted_simulator_udid, find_simulator_by_name, handle_simctl_result
+from sim_utils import run_simctl, find_simulator_by_name, handle_simctl_result
+
+MAX_PARALLEL_ERASES = 4
+ERASE_HINT = 'The simulator must be shut down before erasing. Use sim-shutdown.py first.'
+
+
+def erase_simulator(udid, device_name=None):
+    """
+    Erase one simulator.
+
+    Returns:
+        Tuple of (success: bool, response: dict)
+    """
+    success, stdout, stderr = run_simctl('erase', udid)
+
+    if not success:
+        ok, response = handle_simctl_result(
+            success, stderr, operation='erase simulator',
+            context={'udid': udid}
+        )
+        if not ok:
+            response['hint'] = ERASE_HINT
+        return ok, response
+
+    result = {
+        'success': True,
+        'message': f'Erased simulator {device_name or udid} (factory reset)',
+        'udid': udid,
+    }
+    if device_name:
+        result['name'] = device_name
+    return True, result
+
+
+def erase_simulators(udids):
+    """Erase several simulators in parallel and return their responses in order."""
+    # simctl erase is mostly CoreSimulator and disk work, so cap the number
+    # of simultaneous erases rather than starting them all at once
+    with ThreadPoolExecutor(max_workers=min(len(udids), MAX_PARALLEL_ERASES)) as pool:
+        return [response for _, response in pool.map(erase_simulator, udids)]
 
 
 def main():
     parser = argparse.ArgumentParser(description='Factory reset iOS Simulator (erase all content)')
 
     target = parser.add_mutually_exclusive_group(required=True)
-    target.add_argument('--udid', help='Simulator UDID to erase')
+    target.add_argument('--udid', nargs='+', help='Simulator UDID(s) to erase')
     target.add_argument('--name', help='Simulator name to erase')
     target.add_argument('--all', action='store_true', help='Erase all simulators')
 
@@ -58,8 +100,26 @@ def main():
             sys.exit(1)
         return
 
+    # Erase several simulators at once
+    if args.udid and len(args.udid) > 1:
+        results = erase_simulators(args.udid)
+        failed = [r for r in results if not r.get('success')]
+        response = {
+            'success': not failed,
+            'results': results,
+        }
+        if failed:
+            response['error'] = f'Failed to erase {len(failed)} of {len(results)} simulators'
+            response['hint'] = ERASE_HINT
+        else:
+            response['message'] = f'Erased {len(results)} simulators (factory reset)'
+        print(json.dumps(response, indent=2))
+        if failed:
+            sys.exit(1)
+        return
+
     # Resolve UDID from name if needed
-    udid = args.udid
+    udid = args.udid[0] if args.udid else None
     device_name = None
     if args.name:
         sim = find_simulator_by_name(args.name)
@@ -73,29 +133,12 @@ def main():
         device_name = sim['name']
 
     # Erase the device
-    success, stdout, stderr = run_simctl('erase', udid)
-
-    if not success:
-        ok, response = handle_simctl_result(
-            success, stderr, operation='erase simulator',
-            context={'udid': udid}
-        )
-        if not ok:
-            response['hint'] = 'The simulator must be shut down before erasing. Use sim-shutdown.py first.'
-            print(json.dumps(response))
-            sys.exit(1)
+    ok, response = erase_simulator(udid, device_name)
+    if not ok:
         print(json.dumps(response))
-        return
-
-    result = {
-        'success': True,
-        'message': f'Erased simulator {device_name or udid} (factory reset)',
-        'udid': udid,
-    }
-    if device_name:
-        result['name'] = device_name
+        sys.exit(1)
 
-    print(json.dumps(result, indent=2))
+    print(json.dumps(response, indent=2))
 
 
 if __name__ == '__main__':
@@ -40,7 +40,6 @@ import subprocess
 import json
 import sys
 import argparse
-import time
 
 from sim_utils import get_booted_simulator_udid, activate_simulator, preserve_focus
 
@@ -117,7 +116,8 @@ def send_keystroke(key, modifiers=None, use_keycode=False):
             end tell
             '''
 
-    result = subprocess.run(['osascript', '-e', script], capture_output=True, text=True)
+    result = subprocess.run(['osascript', '-e', script],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
     return result.returncode == 0, result.stderr
 
 
@@ -131,7 +131,8 @@ def send_app_switcher():
         keystroke "h" using {command down, shift down}
     end tell
     '''
-    result = subprocess.run(['osascript', '-e', script], capture_output=True, text=True)
+    result = subprocess.run(['osascript', '-e', script],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
     return result.returncode == 0, result.stderr
 
 
@@ -180,7 +181,8 @@ def clear_text_field():
         key code 51
     end tell
     '''
-    result = subprocess.run(['osascript', '-e', script], capture_output=True, text=True)
+    result = subprocess.run(['osascript', '-e', script],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
     return result.returncode == 0, result.stderr
 
 
@@ -204,7 +206,8 @@ def send_hardware_button(button):
         end tell
     end tell
     '''
-    result = subprocess.run(['osascript', '-e', script], capture_output=True, text=True)
+    result = subprocess.run(['osascript', '-e', script],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
     return result.returncode == 0, result.stderr
 
 
@@ -31,15 +31,31 @@ import signal
 import subprocess
 import sys
 import argparse
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 
 from sim_utils import get_booted_simulator_udid
 
+DURATION_RE = re.compile(r'^(\d+)([smh])$', re.ASCII)
+
+# Severity keywords, checked in order: error, then warning, then info.
+# One alternation per level so each level is a single scan of the line.
+ERROR_RE = re.compile(r'\b(?:error|fault|failed|exception|crash)\b')
+WARNING_RE = re.compile(r'\b(?:warning|warn|deprecated)\b')
+INFO_RE = re.compile(r'\b(?:info|notice)\b')
+
+# Parts of a line that differ between otherwise identical messages. The
+# timestamp and PID that `log stream` writes are plain ASCII digits; the
+# message text is not, so the patterns above keep Unicode word boundaries.
+TIMESTAMP_RE = re.compile(r'\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}', re.ASCII)
+PID_RE = re.compile(r'\[\d+\]', re.ASCII)
+WHITESPACE_RE = re.compile(r'\s+')
+
 
 def parse_duration(duration_str):
     """Parse a duration string like '30s', '5m', '1h' into seconds."""
-    match = re.match(r'^(\d+)([smh])$', duration_str.lower())
+    match = DURATION_RE.match(duration_str.lower())
     if not match:
         return None
     value, unit = int(match.group(1)), match.group(2)
@@ -54,35 +70,33 @@ def classify_severity(line):
     """Classify a log line by severity based on content patterns."""
     lower = line.lower()
 
-    error_patterns = [r'\berror\b', r'\bfault\b', r'\bfailed\b', r'\bexception\b', r'\bcrash\b']
-    for p in error_patterns:
-        if re.search(p, lower):
-            return 'error'
+    if ERROR_RE.search(lower):
+        return 'error'
 
-    warning_patterns = [r'\bwarning\b', r'\bwarn\b', r'\bdeprecated\b']
-    for p in warning_patterns:
-        if re.search(p, lower):
-            return 'warning'
+    if WARNING_RE.search(lower):
+        return 'warning'
 
-    info_patterns = [r'\binfo\b', r'\bnotice\b']
-    for p in info_patterns:
-        if re.search(p, lower):
-            return 'info'
+    if INFO_RE.search(lower):
+        return 'info'
 
     return 'debug'
 
 
 def deduplicate_signature(line):
     """Create a signature for deduplication by stripping timestamps and PIDs."""
-    sig = re.sub(r'\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}', '', line)
-    sig = re.sub(r'\[\d+\]', '', sig)
-    return re.sub(r'\s+', ' ', sig).strip()
+    sig = TIMESTAMP_RE.sub('', line)
+    sig = PID_RE.sub('', sig)
+    return WHITESPACE_RE.sub(' ', sig).strip()
 
 
 def stream_logs(udid, bundle_id=None, severity_filter=None, duration=None,
-                follow=False, verbose=False):
+                follow=False, verbose=False, keep_all=False):
     """Stream and process simulator logs.
 
+    Only the last 50 lines are retained unless keep_all is set (needed when
+    the full log is saved with --output), so memory stays bounded for long
+    captures.
+
     Returns:
         dict with log statistics and captured data, or None on failure.
     """
@@ -98,7 +112,7 @@ def stream_logs(udid, bundle_id=None, severity_filter=None, duration=None,
         severity_filter = set(severity_filter)
 
     # State
-    all_lines = []
+    all_lines = [] if keep_all else deque(maxlen=50)
     errors = []
     warnings = []
     counts = {'error': 0, 'warning': 0, 'info': 0, 'debug': 0, 'total': 0}
@@ -115,23 +129,27 @@ def stream_logs(udid, bundle_id=None, severity_filter=None, duration=None,
     signal.signal(signal.SIGINT, on_signal)
 
     try:
+        # stderr is never read, so don't give it a pipe that could fill up
+        # and stall `log stream` during a long capture.
         process = subprocess.Popen(
-            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
             text=True, bufsize=1
         )
 
         start = datetime.now()
 
-        for line in iter(process.stdout.readline, ''):
-            if not line:
-                break
+        # Bound methods looked up once rather than on every log line
+        add_line = all_lines.append
+        add_error = errors.append
+        add_warning = warnings.append
 
+        for line in process.stdout:
             stripped = line.rstrip()
             if not stripped:
                 continue
 
             counts['total'] += 1
-            all_lines.append(stripped)
+            add_line(stripped)
 
             severity = classify_severity(stripped)
             counts[severity] += 1
@@ -147,9 +165,9 @@ def stream_logs(udid, bundle_id=None, severity_filter=None, duration=None,
                 seen.add(sig)
 
             if severity == 'error':
-                errors.append(stripped)
+                add_error(stripped)
             elif severity == 'warning':
-                warnings.append(stripped)
+                add_warning(stripped)
 
             if follow:
                 print(stripped, flush=True)
@@ -190,7 +208,7 @@ def stream_logs(udid, bundle_id=None, severity_filter=None, duration=None,
     }
 
     if verbose:
-        result['recent_lines'] = all_lines[-50:]
+        result['recent_lines'] = all_lines[-50:] if keep_all else list(all_lines)
 
     return result, all_lines
 
@@ -274,6 +292,7 @@ def main():
         duration=duration,
         follow=args.follow,
         verbose=args.verbose,
+        keep_all=bool(args.output),
     )
 
     if isinstance(output, dict):
@@ -1,4 +1,4 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -S
 """
 Record video from an iOS simulator.
 
@@ -23,7 +23,14 @@ import sys
 import os
 import signal
 import time
-import threading
+
+
+def get_file_size(path):
+    """Return the size of path in bytes, or None if it doesn't exist."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return None
 
 
 def main():
@@ -38,8 +45,10 @@ def main():
 
     output_path = os.path.abspath(args.output)
 
-    # Ensure output directory exists
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    # Ensure output directory exists (usually it already does)
+    output_dir = os.path.dirname(output_path)
+    if not os.path.isdir(output_dir):
+        os.makedirs(output_dir, exist_ok=True)
 
     cmd = [
         "xcrun", "simctl", "io", args.udid, "recordVideo",
@@ -88,8 +97,8 @@ def main():
         process.wait(timeout=10)
 
         # Check if file was created
-        if os.path.exists(output_path):
-            file_size = os.path.getsize(output_path)
+        file_size = get_file_size(output_path)
+        if file_size is not None:
             print(json.dumps({
                 "success": True,
                 "message": "Recording completed",
@@ -110,8 +119,8 @@ def main():
             process.terminate()
             process.wait(timeout=10)
 
-        if os.path.exists(output_path):
-            file_size = os.path.getsize(output_path)
+        file_size = get_file_size(output_path)
+        if file_size is not None:
             print(json.dumps({
                 "success": True,
                 "message": "Recording stopped",
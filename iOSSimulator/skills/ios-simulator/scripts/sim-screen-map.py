@@ -30,6 +30,9 @@ import argparse
 
 from sim_utils import get_booted_simulator_udid
 
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DESCRIBE_SCRIPT = os.path.join(SCRIPT_DIR, 'sim-describe-ui.py')
+
 # AXRoles that are interactive
 INTERACTIVE_ROLES = {
     'AXButton', 'AXLink', 'AXTextField', 'AXSecureTextField',
@@ -50,10 +53,7 @@ def get_flat_elements(udid=None):
     Returns:
         Tuple of (elements_list, error_string)
     """
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    describe_script = os.path.join(script_dir, 'sim-describe-ui.py')
-
-    cmd = [describe_script, '--format', 'flat']
+    cmd = [DESCRIBE_SCRIPT, '--format', 'flat']
     if udid:
         cmd.extend(['--udid', udid])
 
@@ -78,7 +78,7 @@ def get_flat_elements(udid=None):
     except json.JSONDecodeError:
         return None, 'Invalid JSON from sim-describe-ui.py'
     except FileNotFoundError:
-        return None, f'sim-describe-ui.py not found at {describe_script}'
+        return None, f'sim-describe-ui.py not found at {DESCRIBE_SCRIPT}'
 
 
 def analyze_elements(elements):
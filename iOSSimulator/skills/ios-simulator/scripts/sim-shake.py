@@ -20,7 +20,6 @@ import subprocess
 import json
 import sys
 import argparse
-import time
 
 from sim_utils import get_booted_simulator_udid, preserve_focus
 
@@ -34,7 +33,8 @@ def simulate_shake():
         keystroke "z" using {control down, command down}
     end tell
     '''
-    result = subprocess.run(['osascript', '-e', script], capture_output=True, text=True)
+    result = subprocess.run(['osascript', '-e', script],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
     return result.returncode == 0, result.stderr
 
 
@@ -34,7 +34,6 @@ Output:
     JSON object with success status
 """
 
-import subprocess
 import json
 import sys
 import argparse
@@ -79,7 +79,8 @@ def tap_with_applescript(sim_x, sim_y):
         end tell
     end tell
     '''
-    result = subprocess.run(['osascript', '-e', script], capture_output=True, text=True)
+    result = subprocess.run(['osascript', '-e', script],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     return result.returncode == 0
 
 
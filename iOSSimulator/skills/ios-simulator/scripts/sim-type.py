@@ -45,7 +45,8 @@ def type_text(text):
     end tell
     '''
 
-    result = subprocess.run(['osascript', '-e', script], capture_output=True, text=True)
+    result = subprocess.run(['osascript', '-e', script],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
     return result.returncode == 0, result.stderr
 
 
@@ -60,7 +61,8 @@ def clear_text_field():
         key code 51
     end tell
     '''
-    result = subprocess.run(['osascript', '-e', script], capture_output=True, text=True)
+    result = subprocess.run(['osascript', '-e', script],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
     return result.returncode == 0, result.stderr
 
 
@@ -82,7 +84,8 @@ def type_text_slow(text, delay=0.05):
             keystroke "{escaped}"
         end tell
         '''
-        subprocess.run(['osascript', '-e', script], capture_output=True)
+        subprocess.run(['osascript', '-e', script],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         time.sleep(delay)
 
     return True
@@ -6,6 +6,7 @@ This module contains common functions used across multiple sim-*.py scripts
 to reduce code duplication and ensure consistent behavior.
 """
 
+import shutil
 import subprocess
 import json
 import time
@@ -33,6 +34,9 @@ LEFT_BEZEL = 20
 RIGHT_BEZEL = 20
 BOTTOM_BEZEL = 50
 
+# Resolved once so repeated run_simctl calls don't each search PATH for xcrun
+XCRUN = shutil.which('xcrun') or 'xcrun'
+
 
 def run_simctl(*args) -> Tuple[bool, str, str]:
     """
@@ -44,7 +48,7 @@ def run_simctl(*args) -> Tuple[bool, str, str]:
     Returns:
         Tuple of (success: bool, stdout: str, stderr: str)
     """
-    cmd = ['xcrun', 'simctl'] + list(args)
+    cmd = [XCRUN, 'simctl'] + list(args)
     result = subprocess.run(cmd, capture_output=True, text=True)
     return result.returncode == 0, result.stdout, result.stderr
 
@@ -134,7 +138,8 @@ def open_simulator_app() -> None:
 
     Uses -g flag to open in background without stealing focus.
     """
-    subprocess.run(['open', '-g', '-a', 'Simulator'], capture_output=True)
+    subprocess.run(['open', '-g', '-a', 'Simulator'],
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
 
 def get_simulator_window_info(device_name=None):
@@ -195,7 +200,8 @@ def set_point_accurate_mode():
         end tell
     end tell
     '''
-    subprocess.run(['osascript', '-e', script], capture_output=True)
+    subprocess.run(['osascript', '-e', script],
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     time.sleep(0.1)
 
 
@@ -210,7 +216,8 @@ def activate_simulator(point_accurate=False):
         set_point_accurate_mode()
     else:
         script = 'tell application "Simulator" to activate'
-        subprocess.run(['osascript', '-e', script], capture_output=True)
+        subprocess.run(['osascript', '-e', script],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         time.sleep(0.1)
 
 
@@ -250,7 +257,7 @@ def restore_frontmost_app(app_name):
     if app_name and app_name != 'Simulator':
         subprocess.run(
             ['osascript', '-e', f'tell application "{app_name}" to activate'],
-            capture_output=True,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
         )
 
 